@@ -1,7 +1,7 @@
 """Configuration management for MarketFinder ETL pipeline."""
 
 from typing import Optional, List
-from pydantic import Field, validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -71,7 +71,8 @@ class Settings(BaseSettings):
     enable_prometheus: bool = Field(True, description="Enable Prometheus metrics")
     prometheus_port: int = Field(9090, description="Prometheus metrics port")
     
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
         valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -79,7 +80,8 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v.upper()
     
-    @validator("ml_model_update_frequency")
+    @field_validator("ml_model_update_frequency")
+    @classmethod
     def validate_update_frequency(cls, v: str) -> str:
         """Validate model update frequency."""
         valid_frequencies = {"hourly", "daily", "weekly", "monthly"}
@@ -2,6 +2,7 @@
 
 import sys
 import logging
+from functools import cached_property
 from typing import Any, Dict, Optional
 from pathlib import Path
 
@@ -76,9 +77,9 @@ def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
 class LoggerMixin:
     """Mixin class to add structured logging to any class."""
     
-    @property
+    @cached_property
     def logger(self) -> structlog.BoundLogger:
-        """Get a logger instance bound to this class."""
+        """Get a logger instance bound to this class, created on first use."""
         return get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
     
     def log_method_call(self, method_name: str, **kwargs: Any) -> None:
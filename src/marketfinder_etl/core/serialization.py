@@ -0,0 +1,22 @@
+"""JSON serialization helpers shared across the MarketFinder ETL pipeline."""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize the types orjson does not handle natively.
+
+    Decimals are written as strings so prices and amounts keep their exact
+    value in storage and on the wire; readers parse them back with Decimal().
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def dumps_json(obj: Any, option: int = orjson.OPT_UTC_Z) -> bytes:
+    """Encode a value to JSON bytes with orjson and the shared default."""
+    return orjson.dumps(obj, default=json_default, option=option)
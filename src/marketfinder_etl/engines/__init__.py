@@ -1,10 +1,20 @@
-"""Processing engines for MarketFinder ETL pipeline."""
+"""Processing engines for MarketFinder ETL pipeline.
 
-from marketfinder_etl.engines.bucketing import SemanticBucketingEngine
-from marketfinder_etl.engines.filtering import HierarchicalFilteringEngine
-from marketfinder_etl.engines.ml_scoring import MLScoringEngine
-from marketfinder_etl.engines.llm_evaluation import LLMEvaluationEngine
-from marketfinder_etl.engines.arbitrage_detection import ArbitrageDetectionEngine
+Engines are imported lazily on first attribute access, so importing one
+engine module (e.g. ``engines.filtering``) does not pull in the heavy
+dependencies of the others (LLM provider SDKs, scikit-learn).
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    "SemanticBucketingEngine": "marketfinder_etl.engines.bucketing",
+    "HierarchicalFilteringEngine": "marketfinder_etl.engines.filtering",
+    "MLScoringEngine": "marketfinder_etl.engines.ml_scoring",
+    "LLMEvaluationEngine": "marketfinder_etl.engines.llm_evaluation",
+    "ArbitrageDetectionEngine": "marketfinder_etl.engines.arbitrage_detection",
+}
 
 __all__ = [
     "SemanticBucketingEngine",
@@ -12,4 +22,17 @@ __all__ = [
     "MLScoringEngine",
     "LLMEvaluationEngine",
     "ArbitrageDetectionEngine",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import engine classes on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,7 @@ to identify actionable arbitrage opportunities with precise risk assessment.
 """
 
 import asyncio
+import bisect
 import math
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
@@ -15,7 +16,7 @@ from enum import Enum
 
 import polars as pl
 import numpy as np
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.models.arbitrage import ArbitrageOpportunity, LLMEvaluation, ArbitrageStrategy
@@ -40,6 +41,17 @@ class RiskLevel(str, Enum):
     VERY_HIGH = "very_high"      # >50% risk
 
 
+# Upper bounds of the overall risk score for each level, lowest risk first
+_RISK_THRESHOLDS = (0.15, 0.3, 0.5, 0.7)
+_RISK_LEVELS = (RiskLevel.VERY_LOW, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
+_RISK_RANK = {level: rank for rank, level in enumerate(_RISK_LEVELS)}
+
+
+def risk_level_of(overall_risk_score: float) -> RiskLevel:
+    """Map an overall risk score to its RiskLevel."""
+    return _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, overall_risk_score)]
+
+
 @dataclass
 class ArbitrageConfig:
     """Configuration for arbitrage detection."""
@@ -134,6 +146,9 @@ class ArbitrageDetectionEngine(LoggerMixin):
     def __init__(self, config: Optional[ArbitrageConfig] = None):
         self.config = config or ArbitrageConfig()
         self.detected_opportunities: List[ArbitrageOpportunity] = []
+        
+        # Detected opportunities grouped by risk level, in ranked order
+        self._opportunities_by_risk: Dict[RiskLevel, List[ArbitrageOpportunity]] = {}
         self.performance_metrics = {
             "total_analyzed": 0,
             "opportunities_found": 0,
@@ -185,6 +200,12 @@ class ArbitrageDetectionEngine(LoggerMixin):
         )
         
         self.detected_opportunities = viable_opportunities
+        self._opportunities_by_risk = {}
+        for opportunity in viable_opportunities:
+            self._opportunities_by_risk.setdefault(
+                opportunity.risk_assessment.overall_risk_level, []
+            ).append(opportunity)
+        
         return viable_opportunities
     
     async def _analyze_arbitrage_opportunity(
@@ -357,16 +378,7 @@ class ArbitrageDetectionEngine(LoggerMixin):
         overall_risk_score = sum(w * r for w, r in zip(risk_weights, risk_scores))
         
         # Determine risk level
-        if overall_risk_score < 0.15:
-            risk_level = RiskLevel.VERY_LOW
-        elif overall_risk_score < 0.3:
-            risk_level = RiskLevel.LOW
-        elif overall_risk_score < 0.5:
-            risk_level = RiskLevel.MEDIUM
-        elif overall_risk_score < 0.7:
-            risk_level = RiskLevel.HIGH
-        else:
-            risk_level = RiskLevel.VERY_HIGH
+        risk_level = risk_level_of(overall_risk_score)
         
         # Identify primary risks
         primary_risks = []
@@ -488,7 +500,7 @@ class ArbitrageDetectionEngine(LoggerMixin):
         return (
             opportunity.metrics.expected_profit_usd >= Decimal(str(self.config.min_profit_amount)) and
             opportunity.metrics.expected_profit_percentage >= self.config.min_profit_threshold and
-            opportunity.risk_assessment.overall_risk_level.value <= self.config.max_acceptable_risk.value
+            _RISK_RANK[opportunity.risk_assessment.overall_risk_level] <= _RISK_RANK[self.config.max_acceptable_risk]
         )
     
     def _filter_and_rank_opportunities(self, opportunities: List[ArbitrageOpportunity]) -> List[ArbitrageOpportunity]:
@@ -544,10 +556,10 @@ class ArbitrageDetectionEngine(LoggerMixin):
         avg_roi = sum(op.metrics.roi_percentage for op in self.detected_opportunities) / len(self.detected_opportunities)
         
         # Risk distribution
-        risk_distribution = {}
-        for op in self.detected_opportunities:
-            risk_level = op.risk_assessment.overall_risk_level.value
-            risk_distribution[risk_level] = risk_distribution.get(risk_level, 0) + 1
+        risk_distribution = {
+            risk_level.value: len(opportunities)
+            for risk_level, opportunities in self._opportunities_by_risk.items()
+        }
         
         return {
             "total_opportunities": len(self.detected_opportunities),
@@ -565,10 +577,8 @@ class ArbitrageDetectionEngine(LoggerMixin):
     
     def get_opportunities_by_risk_level(self, risk_level: RiskLevel) -> List[ArbitrageOpportunity]:
         """Get opportunities filtered by risk level."""
-        return [
-            op for op in self.detected_opportunities
-            if op.risk_assessment.overall_risk_level == risk_level
-        ]
+        # Resolve to the enum member so plain string levels hit the index too
+        return list(self._opportunities_by_risk.get(RiskLevel(risk_level), ()))
     
     def get_high_priority_opportunities(self, limit: int = 10) -> List[ArbitrageOpportunity]:
         """Get the highest priority opportunities."""
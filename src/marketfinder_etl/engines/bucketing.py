@@ -9,9 +9,10 @@ import asyncio
 import re
 from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from collections import defaultdict, Counter
+from dataclasses import dataclass, field
+from collections import defaultdict, Counter, OrderedDict
 
+import numpy as np
 import polars as pl
 from pydantic import BaseModel
 
@@ -52,6 +53,74 @@ class BucketStats(BaseModel):
     sample_titles: List[str] = []
 
 
+def _platform_counts(summary: pl.DataFrame, platform: str) -> np.ndarray:
+    """Per-bucket market counts for a platform column of the pivoted summary."""
+    if platform not in summary.columns:
+        return np.zeros(summary.height, dtype=np.int64)
+    return summary[platform].to_numpy().astype(np.int64, copy=False)
+
+
+@dataclass(slots=True)
+class BucketPairColumns:
+    """
+    Bucket pairs stored column-wise, one contiguous array per counter.
+    
+    Aggregates over all pairs reduce a single array instead of walking
+    BucketPair objects; indexing yields a BucketPair for API compatibility.
+    """
+    bucket_names: List[str] = field(default_factory=list)
+    kalshi_counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    polymarket_counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    comparison_counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    
+    @classmethod
+    def from_summary(cls, summary: pl.DataFrame) -> "BucketPairColumns":
+        """Build from a bucket x platform count pivot, keeping cross-platform buckets."""
+        kalshi_counts = _platform_counts(summary, 'kalshi')
+        polymarket_counts = _platform_counts(summary, 'polymarket')
+        
+        # Only keep buckets where both platforms have markets
+        cross_platform = np.flatnonzero((kalshi_counts > 0) & (polymarket_counts > 0))
+        comparison_counts = kalshi_counts[cross_platform] * polymarket_counts[cross_platform]
+        
+        # Largest comparison count first to prioritize high-impact buckets
+        ranking = np.argsort(-comparison_counts, kind='stable')
+        order = cross_platform[ranking]
+        bucket_names = summary['bucket'].to_list()
+        
+        return cls(
+            bucket_names=[bucket_names[i] for i in order],
+            kalshi_counts=kalshi_counts[order],
+            polymarket_counts=polymarket_counts[order],
+            comparison_counts=comparison_counts[ranking]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.bucket_names)
+    
+    def __getitem__(self, index: int) -> BucketPair:
+        return BucketPair(
+            bucket_name=self.bucket_names[index],
+            kalshi_count=int(self.kalshi_counts[index]),
+            polymarket_count=int(self.polymarket_counts[index]),
+            comparison_count=int(self.comparison_counts[index])
+        )
+    
+    def to_bucket_pairs(self) -> List[BucketPair]:
+        """Materialize every pair as a BucketPair model."""
+        return [self[i] for i in range(len(self))]
+    
+    @property
+    def total_comparisons(self) -> int:
+        """Total cross-platform comparisons across all bucket pairs."""
+        return int(self.comparison_counts.sum())
+    
+    @property
+    def total_markets(self) -> int:
+        """Total markets across all bucket pairs."""
+        return int(self.kalshi_counts.sum() + self.polymarket_counts.sum())
+
+
 class SemanticBucketingEngine(LoggerMixin):
     """
     Semantic Bucketing Engine for grouping similar markets across platforms.
@@ -60,9 +129,15 @@ class SemanticBucketingEngine(LoggerMixin):
     to create semantic buckets that reduce the comparison space by 99.7%.
     """
     
-    def __init__(self):
+    def __init__(self, assignment_cache_size: int = 10_000):
         self.bucket_definitions = self._create_bucket_definitions()
         self.bucket_stats: Dict[str, BucketStats] = {}
+        self.bucket_pair_columns = BucketPairColumns()
+        
+        # LRU cache of bucket assignments keyed by the market fields that
+        # determine them, so unchanged markets are not rescored across syncs
+        self.assignment_cache_size = assignment_cache_size
+        self._assignment_cache: OrderedDict[Tuple, Tuple[str, float]] = OrderedDict()
         
     def _create_bucket_definitions(self) -> Dict[str, BucketDefinition]:
         """Create comprehensive bucket definitions for market categorization."""
@@ -290,6 +365,23 @@ class SemanticBucketingEngine(LoggerMixin):
     
     def bucket_market(self, market: NormalizedMarket) -> Tuple[str, float]:
         """Assign a market to the best-fitting semantic bucket."""
+        if self.assignment_cache_size <= 0:
+            return self._score_buckets(market)
+        
+        key = (market.title, market.description, market.category, market.end_date, market.created_date)
+        assignment = self._assignment_cache.get(key)
+        if assignment is not None:
+            self._assignment_cache.move_to_end(key)
+            return assignment
+        
+        assignment = self._score_buckets(market)
+        self._assignment_cache[key] = assignment
+        if len(self._assignment_cache) > self.assignment_cache_size:
+            self._assignment_cache.popitem(last=False)
+        return assignment
+    
+    def _score_buckets(self, market: NormalizedMarket) -> Tuple[str, float]:
+        """Score a market against every bucket definition and pick the best."""
         best_bucket = 'miscellaneous'
         best_score = 0.0
         
@@ -311,22 +403,32 @@ class SemanticBucketingEngine(LoggerMixin):
         """Bucket all markets and create bucket pairs for processing."""
         self.logger.info(f"Starting semantic bucketing for {len(markets)} markets")
         
-        # Create DataFrame for efficient processing
-        market_data = []
-        for market in markets:
-            bucket_name, confidence = self.bucket_market(market)
-            market_data.append({
-                'external_id': market.external_id,
-                'platform': market.platform.value,
-                'title': market.title,
-                'category': market.category,
-                'bucket': bucket_name,
-                'confidence': confidence,
-                'volume': float(market.volume),
-                'end_date': market.end_date.isoformat() if market.end_date else None
-            })
+        # Create DataFrame for efficient processing, column by column rather
+        # than via one dict per market
+        assignments = [self.bucket_market(market) for market in markets]
         
-        df = pl.DataFrame(market_data)
+        df = pl.DataFrame(
+            {
+                'external_id': [market.external_id for market in markets],
+                'platform': [market.platform.value for market in markets],
+                'title': [market.title for market in markets],
+                'category': [market.category for market in markets],
+                'bucket': [bucket_name for bucket_name, _ in assignments],
+                'confidence': [confidence for _, confidence in assignments],
+                'volume': [float(market.volume) for market in markets],
+                'end_date': [market.end_date for market in markets]
+            },
+            schema={
+                'external_id': pl.Utf8,
+                'platform': pl.Utf8,
+                'title': pl.Utf8,
+                'category': pl.Utf8,
+                'bucket': pl.Utf8,
+                'confidence': pl.Float64,
+                'volume': pl.Float64,
+                'end_date': pl.Datetime
+            }
+        )
         
         # Update bucket statistics
         self._update_bucket_stats(df)
@@ -336,7 +438,7 @@ class SemanticBucketingEngine(LoggerMixin):
         
         self.logger.info(
             f"Bucketing complete: {len(bucket_pairs)} bucket pairs created",
-            total_comparisons=sum(pair.comparison_count for pair in bucket_pairs)
+            total_comparisons=self.bucket_pair_columns.total_comparisons
         )
         
         return bucket_pairs
@@ -354,40 +456,43 @@ class SemanticBucketingEngine(LoggerMixin):
             ])
         )
         
-        # Create BucketStats objects
-        for bucket_name in df['bucket'].unique():
-            bucket_data = bucket_stats.filter(pl.col('bucket') == bucket_name)
-            
-            kalshi_count = 0
-            polymarket_count = 0
-            total_confidence = 0.0
-            sample_titles = []
+        # Accumulate every bucket's counts in one pass over the grouped rows,
+        # rather than filtering the grouped frame once per bucket
+        accumulated: Dict[str, Dict[str, Any]] = {}
+        for row in bucket_stats.iter_rows(named=True):
+            acc = accumulated.setdefault(row['bucket'], {
+                'kalshi_count': 0,
+                'polymarket_count': 0,
+                'total_confidence': 0.0,
+                'sample_titles': []
+            })
             
-            for row in bucket_data.iter_rows(named=True):
-                if row['platform'] == 'kalshi':
-                    kalshi_count = row['count']
-                elif row['platform'] == 'polymarket':
-                    polymarket_count = row['count']
-                
-                total_confidence += row['avg_confidence'] * row['count']
-                sample_titles.extend(row['sample_titles'])
+            if row['platform'] == 'kalshi':
+                acc['kalshi_count'] = row['count']
+            elif row['platform'] == 'polymarket':
+                acc['polymarket_count'] = row['count']
             
-            total_markets = kalshi_count + polymarket_count
-            avg_confidence = total_confidence / total_markets if total_markets > 0 else 0.0
+            acc['total_confidence'] += row['avg_confidence'] * row['count']
+            acc['sample_titles'].extend(row['sample_titles'])
+        
+        # Create BucketStats objects
+        last_updated = datetime.utcnow()
+        for bucket_name, acc in accumulated.items():
+            total_markets = acc['kalshi_count'] + acc['polymarket_count']
+            avg_confidence = acc['total_confidence'] / total_markets if total_markets > 0 else 0.0
             
             self.bucket_stats[bucket_name] = BucketStats(
                 bucket_name=bucket_name,
-                kalshi_count=kalshi_count,
-                polymarket_count=polymarket_count,
+                kalshi_count=acc['kalshi_count'],
+                polymarket_count=acc['polymarket_count'],
                 total_markets=total_markets,
                 avg_confidence=avg_confidence,
-                last_updated=datetime.utcnow(),
-                sample_titles=sample_titles[:5]  # Keep only 5 samples
+                last_updated=last_updated,
+                sample_titles=acc['sample_titles'][:5]  # Keep only 5 samples
             )
     
     def _create_bucket_pairs(self, df: pl.DataFrame) -> List[BucketPair]:
         """Create bucket pairs for cross-platform comparison."""
-        bucket_pairs = []
         
         # Get cross-platform bucket summary
         bucket_summary = (
@@ -398,28 +503,10 @@ class SemanticBucketingEngine(LoggerMixin):
             .fill_null(0)
         )
         
-        for row in bucket_summary.iter_rows(named=True):
-            bucket_name = row['bucket']
-            kalshi_count = row.get('kalshi', 0)
-            polymarket_count = row.get('polymarket', 0)
-            
-            # Only create pairs where both platforms have markets
-            if kalshi_count > 0 and polymarket_count > 0:
-                comparison_count = kalshi_count * polymarket_count
-                
-                bucket_pair = BucketPair(
-                    bucket_name=bucket_name,
-                    kalshi_count=kalshi_count,
-                    polymarket_count=polymarket_count,
-                    comparison_count=comparison_count
-                )
-                
-                bucket_pairs.append(bucket_pair)
-        
-        # Sort by comparison count (largest first) to prioritize high-impact buckets
-        bucket_pairs.sort(key=lambda x: x.comparison_count, reverse=True)
+        # Keep the counters column-wise for aggregate queries
+        self.bucket_pair_columns = BucketPairColumns.from_summary(bucket_summary)
         
-        return bucket_pairs
+        return self.bucket_pair_columns.to_bucket_pairs()
     
     def get_bucket_statistics(self) -> Dict[str, BucketStats]:
         """Get current bucket statistics."""
@@ -474,9 +561,9 @@ class SemanticBucketingEngine(LoggerMixin):
         """Analyze the effectiveness of bucket definitions."""
         analysis = {
             'total_buckets': len(self.bucket_stats),
-            'active_buckets': len([b for b in self.bucket_stats.values() if b.total_markets > 0]),
-            'cross_platform_buckets': len([b for b in self.bucket_stats.values() 
-                                         if b.kalshi_count > 0 and b.polymarket_count > 0]),
+            'active_buckets': sum(1 for b in self.bucket_stats.values() if b.total_markets > 0),
+            'cross_platform_buckets': sum(1 for b in self.bucket_stats.values()
+                                          if b.kalshi_count > 0 and b.polymarket_count > 0),
             'bucket_efficiency': {},
             'top_buckets_by_volume': [],
             'empty_buckets': []
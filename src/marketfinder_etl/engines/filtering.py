@@ -7,20 +7,40 @@ reducing the comparison space from 500K to ~50K pairs (90% reduction).
 
 import asyncio
 import math
-from typing import Any, Dict, List, Optional, Set, Tuple
+import time
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, get_args
 from datetime import datetime, timedelta
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
 import polars as pl
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from sklearn.feature_extraction.text import CountVectorizer
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.models.market import NormalizedMarket, MarketPlatform
 from marketfinder_etl.models.pipeline import BucketPair
 
 
+# Decimal constants used per pair, built once instead of on every call
+_ZERO = Decimal('0')
+_DEFAULT_PRICE = Decimal('0.5')
+_MIN_VALID_PRICE = Decimal('0.01')
+_MAX_VALID_PRICE = Decimal('0.99')
+_TRANSACTION_COST = Decimal('0.01')  # 1% transaction cost
+
+# Words ignored when comparing market titles
+_TITLE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'will', 'be', 'is', 'are'
+})
+
+# Outcome names treated as the Yes side of a binary market
+_YES_OUTCOME_NAMES = frozenset({'yes', 'true', '1'})
+
+
 class FilterStage(str, Enum):
     """Hierarchical filtering stages."""
     BASIC_COMPATIBILITY = "basic_compatibility"
@@ -30,10 +50,24 @@ class FilterStage(str, Enum):
     ARBITRAGE_POTENTIAL = "arbitrage_potential"
 
 
-@dataclass
+# How stages 2-5 are ordered; see HierarchicalFilteringEngine.get_filter_order
+FilterOrderStrategy = Literal["static", "cost_based", "adaptive"]
+_FILTER_ORDER_STRATEGIES = frozenset(get_args(FilterOrderStrategy))
+
+
+def validate_filter_order_strategy(strategy: str) -> None:
+    """Raise ValueError for an unknown filter order strategy."""
+    if strategy not in _FILTER_ORDER_STRATEGIES:
+        raise ValueError(
+            f"Unknown filter_order_strategy {strategy!r}; "
+            f"expected one of {', '.join(sorted(_FILTER_ORDER_STRATEGIES))}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class FilterConfig:
     """Configuration for filtering parameters."""
-    # Basic compatibility filters
+    # Basic compatibility filters (inclusive bounds, compared as decimals)
     min_volume_threshold: float = 100.0
     min_price_range: float = 0.05  # 5%
     max_price_range: float = 0.95  # 95%
@@ -55,6 +89,35 @@ class FilterConfig:
     # Performance settings
     enable_parallel_processing: bool = True
     batch_size: int = 1000
+    
+    # Filter ordering for stages 2-5 (stage 1 always runs first)
+    filter_order_strategy: FilterOrderStrategy = "adaptive"
+    # Ordering hints by stage value; left out of hashing and equality so the config stays hashable
+    filter_costs: Dict[str, float] = field(default_factory=dict, hash=False, compare=False)  # Relative cost per pair
+    filter_selectivity: Dict[str, float] = field(default_factory=dict, hash=False, compare=False)  # Fraction of pairs passed
+    
+    def __post_init__(self):
+        validate_filter_order_strategy(self.filter_order_strategy)
+
+
+# Stages after basic compatibility, in their static order. Each only sets its
+# own score on a pair, so they can run in any order with the same result.
+_REORDERABLE_STAGES = (
+    FilterStage.TEXT_SIMILARITY,
+    FilterStage.LIQUIDITY_FILTERING,
+    FilterStage.TIME_WINDOW_ALIGNMENT,
+    FilterStage.ARBITRAGE_POTENTIAL,
+)
+
+# Smoothing factor for the measured per-stage cost and pass rate
+_FILTER_STATS_EMA_ALPHA = 0.2
+
+
+def _filter_rank(cost: float, pass_rate: float) -> float:
+    """Cost per pair eliminated; filters with the lowest rank should run first."""
+    if pass_rate >= 1.0:
+        return math.inf
+    return cost / (1.0 - pass_rate)
 
 
 class MarketPair(BaseModel):
@@ -80,11 +143,11 @@ class MarketPair(BaseModel):
     time_alignment_score: Optional[float] = None
     arbitrage_potential: Optional[Decimal] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
-class FilteringStats(BaseModel):
+@dataclass(slots=True)
+class FilteringStats:
     """Statistics for filtering stage."""
     stage: FilterStage
     input_count: int
@@ -92,7 +155,7 @@ class FilteringStats(BaseModel):
     filtered_count: int
     filter_rate: float
     processing_time_ms: int
-    top_filter_reasons: Dict[str, int] = {}
+    top_filter_reasons: Dict[str, int] = field(default_factory=dict)
 
 
 class HierarchicalFilteringEngine(LoggerMixin):
@@ -110,6 +173,18 @@ class HierarchicalFilteringEngine(LoggerMixin):
     def __init__(self, config: Optional[FilterConfig] = None):
         self.config = config or FilterConfig()
         self.filtering_stats: List[FilteringStats] = []
+        
+        self._stage_filters = {
+            FilterStage.TEXT_SIMILARITY: self._text_similarity_filter,
+            FilterStage.LIQUIDITY_FILTERING: self._liquidity_filter,
+            FilterStage.TIME_WINDOW_ALIGNMENT: self._time_window_filter,
+            FilterStage.ARBITRAGE_POTENTIAL: self._arbitrage_potential_filter,
+        }
+        
+        # Moving averages of each stage's cost (ns per pair) and pass rate,
+        # carried across buckets and pipeline runs for adaptive ordering
+        self._stage_cost_ema: Dict[FilterStage, float] = {}
+        self._stage_pass_rate_ema: Dict[FilterStage, float] = {}
     
     async def filter_bucket_pairs(self, bucket_name: str, markets: List[NormalizedMarket]) -> List[MarketPair]:
         """Apply hierarchical filtering to a bucket of markets."""
@@ -132,17 +207,20 @@ class HierarchicalFilteringEngine(LoggerMixin):
         # Stage 1: Basic compatibility check
         compatible_pairs = await self._basic_compatibility_filter(kalshi_markets, polymarket_markets, bucket_name)
         
-        # Stage 2: Text similarity pre-screening
-        text_similar_pairs = await self._text_similarity_filter(compatible_pairs)
-        
-        # Stage 3: Liquidity and volume filtering
-        liquid_pairs = await self._liquidity_filter(text_similar_pairs)
-        
-        # Stage 4: Time window alignment
-        time_aligned_pairs = await self._time_window_filter(liquid_pairs)
-        
-        # Stage 5: Arbitrage potential assessment
-        viable_pairs = await self._arbitrage_potential_filter(time_aligned_pairs)
+        # Stages 2-5: text similarity, liquidity, time window alignment and
+        # arbitrage potential, cheapest-per-rejection first unless static
+        viable_pairs = compatible_pairs
+        for stage in self.get_filter_order():
+            input_count = len(viable_pairs)
+            start_ns = time.monotonic_ns()
+            viable_pairs = await self._stage_filters[stage](viable_pairs)
+            
+            if input_count:
+                self._record_stage_performance(
+                    stage,
+                    (time.monotonic_ns() - start_ns) / input_count,
+                    len(viable_pairs) / input_count
+                )
         
         self.logger.info(
             f"Filtering complete for bucket {bucket_name}",
@@ -160,13 +238,50 @@ class HierarchicalFilteringEngine(LoggerMixin):
         bucket_name: str
     ) -> List[MarketPair]:
         """Stage 1: Basic compatibility check."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         compatible_pairs = []
         filter_reasons = {}
         
         total_potential = len(kalshi_markets) * len(polymarket_markets)
         self.logger.debug(f"Stage 1: Checking {total_potential} potential pairs for basic compatibility")
         
+        # Thresholds as Decimals, converted once so per-pair comparisons with
+        # market prices and volumes stay Decimal-to-Decimal. Every bound is
+        # inclusive at its configured decimal value: a volume equal to
+        # min_volume_threshold, a price equal to min_price_range or
+        # max_price_range and a spread equal to min_arbitrage_potential all pass
+        # (comparing against the binary floats rejected the default 0.05, 0.95
+        # and 0.02 boundaries).
+        min_volume = Decimal(str(self.config.min_volume_threshold))
+        min_price = Decimal(str(self.config.min_price_range))
+        max_price = Decimal(str(self.config.max_price_range))
+        min_arbitrage = Decimal(str(self.config.min_arbitrage_potential))
+        
+        # Polymarket-only checks do not depend on the Kalshi side, so run them
+        # once per market and replay their counts for every Kalshi market
+        polymarket_rejections: Dict[str, int] = {}
+        polymarket_candidates: List[Tuple[NormalizedMarket, Decimal]] = []
+        for polymarket_market in polymarket_markets:
+            polymarket_price = self._get_yes_price(polymarket_market)
+            
+            if not self._is_valid_price(polymarket_price):
+                reason = 'polymarket_invalid_price'
+            elif polymarket_market.volume < min_volume:
+                reason = 'polymarket_low_volume'
+            elif polymarket_market.end_date is None:
+                reason = 'polymarket_missing_close_time'
+            else:
+                polymarket_candidates.append((polymarket_market, polymarket_price))
+                continue
+            
+            polymarket_rejections[reason] = polymarket_rejections.get(reason, 0) + 1
+        
+        polymarket_in_range = [
+            (market, price) for market, price in polymarket_candidates
+            if min_price <= price <= max_price
+        ]
+        polymarket_out_of_range = len(polymarket_candidates) - len(polymarket_in_range)
+        
         for kalshi_market in kalshi_markets:
             kalshi_price = self._get_yes_price(kalshi_market)
             
@@ -176,40 +291,36 @@ class HierarchicalFilteringEngine(LoggerMixin):
                 continue
             
             # Skip low volume markets
-            if kalshi_market.volume < self.config.min_volume_threshold:
+            if kalshi_market.volume < min_volume:
                 filter_reasons['kalshi_low_volume'] = filter_reasons.get('kalshi_low_volume', 0) + len(polymarket_markets)
                 continue
             
-            for polymarket_market in polymarket_markets:
-                polymarket_price = self._get_yes_price(polymarket_market)
-                
-                # Skip markets with invalid pricing
-                if not self._is_valid_price(polymarket_price):
-                    filter_reasons['polymarket_invalid_price'] = filter_reasons.get('polymarket_invalid_price', 0) + 1
-                    continue
-                
-                # Skip low volume markets
-                if polymarket_market.volume < self.config.min_volume_threshold:
-                    filter_reasons['polymarket_low_volume'] = filter_reasons.get('polymarket_low_volume', 0) + 1
-                    continue
-                
-                # Check price range validity
-                if not (self.config.min_price_range <= kalshi_price <= self.config.max_price_range):
-                    filter_reasons['kalshi_price_range'] = filter_reasons.get('kalshi_price_range', 0) + 1
-                    continue
-                
-                if not (self.config.min_price_range <= polymarket_price <= self.config.max_price_range):
-                    filter_reasons['polymarket_price_range'] = filter_reasons.get('polymarket_price_range', 0) + 1
-                    continue
-                
+            # Pairs need both close times for time window alignment
+            if kalshi_market.end_date is None:
+                filter_reasons['kalshi_missing_close_time'] = filter_reasons.get('kalshi_missing_close_time', 0) + len(polymarket_markets)
+                continue
+            
+            for reason, count in polymarket_rejections.items():
+                filter_reasons[reason] = filter_reasons.get(reason, 0) + count
+            
+            # Check price range validity
+            if not (min_price <= kalshi_price <= max_price):
+                filter_reasons['kalshi_price_range'] = filter_reasons.get('kalshi_price_range', 0) + len(polymarket_candidates)
+                continue
+            
+            if polymarket_out_of_range:
+                filter_reasons['polymarket_price_range'] = filter_reasons.get('polymarket_price_range', 0) + polymarket_out_of_range
+            
+            for polymarket_market, polymarket_price in polymarket_in_range:
                 # Check minimum arbitrage potential
                 price_diff = abs(kalshi_price - polymarket_price)
-                if price_diff < self.config.min_arbitrage_potential:
+                if price_diff < min_arbitrage:
                     filter_reasons['insufficient_arbitrage'] = filter_reasons.get('insufficient_arbitrage', 0) + 1
                     continue
                 
-                # Create market pair
-                pair = MarketPair(
+                # Create market pair; every field comes from validated markets
+                # or was range-checked above, so skip re-validating it per pair
+                pair = MarketPair.model_construct(
                     kalshi_id=kalshi_market.external_id,
                     polymarket_id=polymarket_market.external_id,
                     kalshi_title=kalshi_market.title,
@@ -228,7 +339,7 @@ class HierarchicalFilteringEngine(LoggerMixin):
                 
                 compatible_pairs.append(pair)
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
         
         # Record statistics
         stats = FilteringStats(
@@ -252,15 +363,35 @@ class HierarchicalFilteringEngine(LoggerMixin):
     
     async def _text_similarity_filter(self, pairs: List[MarketPair]) -> List[MarketPair]:
         """Stage 2: Text similarity pre-screening."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         similar_pairs = []
         filter_reasons = {}
         
         self.logger.debug(f"Stage 2: Analyzing text similarity for {len(pairs)} pairs")
         
-        for pair in pairs:
-            # Calculate text similarity
-            title_similarity = self._calculate_text_similarity(pair.kalshi_title, pair.polymarket_title)
+        # Pairs with a significant price difference pass regardless of text,
+        # so only they need an exact score when the similarity bound is low
+        significant_price_diffs = np.fromiter(
+            (pair.price_difference >= 0.1 for pair in pairs),  # 10% difference
+            dtype=bool,
+            count=len(pairs)
+        )
+        min_title_similarity = (
+            self.config.min_text_similarity / self.config.title_weight
+            if self.config.title_weight > 0 else 0.0
+        )
+        
+        # Title similarity for every pair in one sparse pass
+        title_similarities = self._batch_text_similarity(
+            [pair.kalshi_title for pair in pairs],
+            [pair.polymarket_title for pair in pairs],
+            min_similarity=min_title_similarity,
+            exact=significant_price_diffs
+        )
+        
+        for pair, title_similarity, significant_price_diff in zip(
+            pairs, title_similarities.tolist(), significant_price_diffs.tolist()
+        ):
             
             # Include description if available (would need to be added to MarketPair)
             description_similarity = 0.0  # Placeholder
@@ -274,14 +405,12 @@ class HierarchicalFilteringEngine(LoggerMixin):
             pair.text_similarity = overall_similarity
             
             # Filter by similarity threshold OR significant price difference
-            significant_price_diff = pair.price_difference >= 0.1  # 10% difference
-            
             if overall_similarity >= self.config.min_text_similarity or significant_price_diff:
                 similar_pairs.append(pair)
             else:
                 filter_reasons['low_text_similarity'] = filter_reasons.get('low_text_similarity', 0) + 1
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
         
         # Record statistics
         stats = FilteringStats(
@@ -305,37 +434,45 @@ class HierarchicalFilteringEngine(LoggerMixin):
     
     async def _liquidity_filter(self, pairs: List[MarketPair]) -> List[MarketPair]:
         """Stage 3: Liquidity and volume filtering."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         liquid_pairs = []
         filter_reasons = {}
         
         self.logger.debug(f"Stage 3: Analyzing liquidity for {len(pairs)} pairs")
         
-        for pair in pairs:
-            # Calculate liquidity scores
-            kalshi_liquidity = self._calculate_liquidity_score(pair.kalshi_volume, pair.kalshi_price)
-            polymarket_liquidity = self._calculate_liquidity_score(pair.polymarket_volume, pair.polymarket_price)
-            
-            # Combined liquidity score
-            pair.liquidity_score = (kalshi_liquidity + polymarket_liquidity) / 2
-            
-            # Check minimum liquidity
-            if pair.liquidity_score < self.config.min_liquidity_score:
-                filter_reasons['low_liquidity'] = filter_reasons.get('low_liquidity', 0) + 1
-                continue
-            
-            # Check volume ratio (avoid extreme volume imbalances)
-            min_volume = min(float(pair.kalshi_volume), float(pair.polymarket_volume))
-            max_volume = max(float(pair.kalshi_volume), float(pair.polymarket_volume))
-            volume_ratio = min_volume / max_volume if max_volume > 0 else 0
-            
-            if volume_ratio < self.config.volume_ratio_threshold:
-                filter_reasons['volume_imbalance'] = filter_reasons.get('volume_imbalance', 0) + 1
-                continue
-            
-            liquid_pairs.append(pair)
+        # Score every pair at once on float arrays
+        count = len(pairs)
+        kalshi_volume = np.fromiter((pair.kalshi_volume for pair in pairs), dtype=np.float64, count=count)
+        polymarket_volume = np.fromiter((pair.polymarket_volume for pair in pairs), dtype=np.float64, count=count)
+        kalshi_price = np.fromiter((pair.kalshi_price for pair in pairs), dtype=np.float64, count=count)
+        polymarket_price = np.fromiter((pair.polymarket_price for pair in pairs), dtype=np.float64, count=count)
+        
+        # Combined liquidity score
+        liquidity_scores = (
+            self._calculate_liquidity_scores(kalshi_volume, kalshi_price) +
+            self._calculate_liquidity_scores(polymarket_volume, polymarket_price)
+        ) / 2
+        
+        # Volume ratio (avoid extreme volume imbalances)
+        max_volume = np.maximum(kalshi_volume, polymarket_volume)
+        min_volume = np.minimum(kalshi_volume, polymarket_volume)
+        volume_ratio = np.divide(min_volume, max_volume, out=np.zeros(count), where=max_volume > 0)
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        low_liquidity = liquidity_scores < self.config.min_liquidity_score
+        volume_imbalance = ~low_liquidity & (volume_ratio < self.config.volume_ratio_threshold)
+        
+        if low_liquidity.any():
+            filter_reasons['low_liquidity'] = int(low_liquidity.sum())
+        if volume_imbalance.any():
+            filter_reasons['volume_imbalance'] = int(volume_imbalance.sum())
+        
+        passed = ~(low_liquidity | volume_imbalance)
+        for pair, liquidity_score, keep in zip(pairs, liquidity_scores.tolist(), passed.tolist()):
+            pair.liquidity_score = liquidity_score
+            if keep:
+                liquid_pairs.append(pair)
+        
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
         
         # Record statistics
         stats = FilteringStats(
@@ -359,7 +496,7 @@ class HierarchicalFilteringEngine(LoggerMixin):
     
     async def _time_window_filter(self, pairs: List[MarketPair]) -> List[MarketPair]:
         """Stage 4: Time window alignment."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         aligned_pairs = []
         filter_reasons = {}
         
@@ -392,7 +529,7 @@ class HierarchicalFilteringEngine(LoggerMixin):
             
             aligned_pairs.append(pair)
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
         
         # Record statistics
         stats = FilteringStats(
@@ -416,24 +553,26 @@ class HierarchicalFilteringEngine(LoggerMixin):
     
     async def _arbitrage_potential_filter(self, pairs: List[MarketPair]) -> List[MarketPair]:
         """Stage 5: Arbitrage potential assessment."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         viable_pairs = []
         filter_reasons = {}
         
         self.logger.debug(f"Stage 5: Analyzing arbitrage potential for {len(pairs)} pairs")
         
+        min_arbitrage_potential = Decimal(str(self.config.min_arbitrage_potential))
+        
         for pair in pairs:
             # Calculate arbitrage potential
             arbitrage_potential = self._calculate_arbitrage_potential(pair)
             pair.arbitrage_potential = arbitrage_potential
             
             # Filter by minimum arbitrage potential
-            if arbitrage_potential >= Decimal(str(self.config.min_arbitrage_potential)):
+            if arbitrage_potential >= min_arbitrage_potential:
                 viable_pairs.append(pair)
             else:
                 filter_reasons['insufficient_arbitrage'] = filter_reasons.get('insufficient_arbitrage', 0) + 1
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
         
         # Record statistics
         stats = FilteringStats(
@@ -458,54 +597,87 @@ class HierarchicalFilteringEngine(LoggerMixin):
     def _get_yes_price(self, market: NormalizedMarket) -> Decimal:
         """Extract Yes price from market outcomes."""
         for outcome in market.outcomes:
-            if outcome.name.lower() in ['yes', 'true', '1']:
+            if outcome.name.lower() in _YES_OUTCOME_NAMES:
                 return outcome.price
         
         # If no explicit Yes outcome, use first outcome
         if market.outcomes:
             return market.outcomes[0].price
         
-        return Decimal('0.5')  # Default fallback
+        return _DEFAULT_PRICE  # Default fallback
     
     def _is_valid_price(self, price: Decimal) -> bool:
         """Check if price is valid for arbitrage analysis."""
-        return Decimal('0.01') <= price <= Decimal('0.99')
+        return _MIN_VALID_PRICE <= price <= _MAX_VALID_PRICE
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate Jaccard similarity between two texts."""
-        if not text1 or not text2:
-            return 0.0
-        
-        # Normalize and tokenize
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'will', 'be', 'is', 'are'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
+    def _batch_text_similarity(
+        self,
+        titles1: List[str],
+        titles2: List[str],
+        min_similarity: float = 0.0,
+        exact: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Jaccard similarity of each (titles1[i], titles2[i]) pair, vectorized.
+        
+        Each distinct title is tokenized once into a row of a binary sparse
+        matrix; pair intersections are row-wise products of that matrix.
+        
+        Jaccard never exceeds min(|a|, |b|) / max(|a|, |b|), so pairs whose
+        size ratio is below ``min_similarity`` are reported as 0.0 without
+        computing their intersection, unless flagged in the ``exact`` mask.
+        """
+        if not titles1:
+            return np.zeros(0)
+        
+        # Map each distinct title to one matrix row
+        title_rows: Dict[str, int] = {}
+        rows1 = np.fromiter((title_rows.setdefault(t, len(title_rows)) for t in titles1), dtype=np.int64, count=len(titles1))
+        rows2 = np.fromiter((title_rows.setdefault(t, len(title_rows)) for t in titles2), dtype=np.int64, count=len(titles2))
+        
+        vectorizer = CountVectorizer(
+            binary=True,
+            lowercase=True,
+            token_pattern=r"(?u)\S+",
+            stop_words=list(_TITLE_STOP_WORDS),
+            dtype=np.int32
+        )
+        try:
+            tokens = vectorizer.fit_transform(list(title_rows)).tocsr()
+        except ValueError:
+            # Every title was empty or only stop words
+            return np.zeros(len(titles1))
+        
+        token_counts = np.asarray(tokens.sum(axis=1)).ravel()
+        size1 = token_counts[rows1]
+        size2 = token_counts[rows2]
+        
+        valid = (size1 > 0) & (size2 > 0)
+        if min_similarity > 0:
+            # Length-ratio prune: skip pairs that cannot reach min_similarity
+            size_bound = np.minimum(size1, size2) / np.maximum(np.maximum(size1, size2), 1)
+            candidates = size_bound >= min_similarity
+            if exact is not None:
+                candidates |= exact
+            valid &= candidates
+        
+        rows1, rows2 = rows1[valid], rows2[valid]
+        intersection = np.asarray(tokens[rows1].multiply(tokens[rows2]).sum(axis=1)).ravel()
+        union = size1[valid] + size2[valid] - intersection
+        
+        similarity = np.zeros(len(titles1))
+        similarity[valid] = intersection / union
+        return similarity
     
-    def _calculate_liquidity_score(self, volume: Decimal, price: Decimal) -> float:
-        """Calculate liquidity score based on volume and price."""
+    def _calculate_liquidity_scores(self, volumes: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """Liquidity scores for arrays of volumes and prices, on a 0-1 log scale."""
         # Adjust volume by price distance from 0.5 (more liquid near 50%)
-        price_adjustment = 1.0 - abs(float(price) - 0.5) * 2
-        adjusted_volume = float(volume) * max(0.1, price_adjustment)
+        price_adjustment = 1.0 - np.abs(prices - 0.5) * 2
+        adjusted_volume = volumes * np.maximum(0.1, price_adjustment)
         
-        # Log-scale normalization
-        if adjusted_volume <= 0:
-            return 0.0
-        
-        # Normalize to 0-1 scale (assuming max volume of ~10000)
-        return min(1.0, math.log10(adjusted_volume + 1) / 4.0)
+        scores = np.zeros(len(volumes))
+        positive = adjusted_volume > 0
+        scores[positive] = np.minimum(1.0, np.log10(adjusted_volume[positive] + 1) / 4.0)
+        return scores
     
     def _calculate_arbitrage_potential(self, pair: MarketPair) -> Decimal:
         """Calculate arbitrage potential for a market pair."""
@@ -513,10 +685,37 @@ class HierarchicalFilteringEngine(LoggerMixin):
         price_diff = abs(pair.kalshi_price - pair.polymarket_price)
         
         # Account for transaction costs (simplified)
-        transaction_cost = Decimal('0.01')  # 1% transaction cost
-        
-        net_arbitrage = price_diff - transaction_cost
-        return max(Decimal('0'), net_arbitrage)
+        net_arbitrage = price_diff - _TRANSACTION_COST
+        return max(_ZERO, net_arbitrage)
+    
+    def get_filter_order(self) -> List[FilterStage]:
+        """Order in which stages 2-5 run under the configured strategy."""
+        strategy = self.config.filter_order_strategy
+        if strategy == "static":
+            return list(_REORDERABLE_STAGES)
+        
+        def rank(stage: FilterStage) -> float:
+            # Configured hints seed the order; adaptive mode prefers measurements
+            cost = self.config.filter_costs.get(stage.value, 1.0)
+            pass_rate = self.config.filter_selectivity.get(stage.value, 0.0)
+            if strategy == "adaptive" and stage in self._stage_cost_ema:
+                cost = self._stage_cost_ema[stage]
+                pass_rate = self._stage_pass_rate_ema[stage]
+            return _filter_rank(cost, pass_rate)
+        
+        # Stable sort keeps the static order between equally ranked stages
+        return sorted(_REORDERABLE_STAGES, key=rank)
+    
+    def _record_stage_performance(self, stage: FilterStage, cost_ns: float, pass_rate: float) -> None:
+        """Fold one stage run into the cost and pass rate moving averages."""
+        if stage not in self._stage_cost_ema:
+            self._stage_cost_ema[stage] = cost_ns
+            self._stage_pass_rate_ema[stage] = pass_rate
+            return
+        
+        alpha = _FILTER_STATS_EMA_ALPHA
+        self._stage_cost_ema[stage] += alpha * (cost_ns - self._stage_cost_ema[stage])
+        self._stage_pass_rate_ema[stage] += alpha * (pass_rate - self._stage_pass_rate_ema[stage])
     
     def get_filtering_statistics(self) -> List[FilteringStats]:
         """Get filtering statistics for all stages."""
@@ -538,6 +737,7 @@ class HierarchicalFilteringEngine(LoggerMixin):
         analysis = {
             'overall_reduction': 1 - (total_output / total_input) if total_input > 0 else 0,
             'total_processing_time_ms': total_processing_time,
+            'filter_order': [stage.value for stage in self.get_filter_order()],
             'stage_breakdown': [],
             'bottleneck_stages': [],
             'filter_effectiveness': {}
@@ -6,7 +6,6 @@ of market pairs, reducing the comparison space from 1K to ~50 pairs (95% reducti
 """
 
 import asyncio
-import json
 import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
@@ -16,6 +15,7 @@ from enum import Enum
 import hashlib
 
 import openai
+import orjson
 import anthropic
 from google.cloud import aiplatform
 from pydantic import BaseModel
@@ -71,6 +71,59 @@ class LLMConfig:
     cost_tracking: bool = True
 
 
+# System prompt shared by every evaluation request
+_SYSTEM_PROMPT = """
+You are an expert financial analyst specializing in prediction market arbitrage. Your task is to evaluate pairs of prediction markets from different platforms (Kalshi and Polymarket) to determine if they represent the same underlying event and offer genuine arbitrage opportunities.
+
+Key considerations:
+- Markets must be asking about the same specific event or outcome
+- Price differences must exceed transaction costs (~2-3%)
+- Markets should have sufficient liquidity
+- Time alignment is important for risk management
+- Consider regulatory and platform-specific risks
+
+Be conservative in your evaluations - only recommend pairs with very high confidence.
+"""
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for LLM requests.
+    
+    Tokens refill continuously at ``rate_per_second`` up to ``capacity``;
+    each request takes one token and only waits when the bucket is empty.
+    """
+    
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.rate_per_second)
+        self._last_refill = now
+    
+    async def acquire(self) -> float:
+        """Take one token, waiting for a refill if needed; returns seconds waited."""
+        async with self._lock:
+            self._refill()
+            wait_time = 0.0
+            if self.tokens < 1:
+                wait_time = (1 - self.tokens) / self.rate_per_second
+                await asyncio.sleep(wait_time)
+                self._refill()
+            self.tokens -= 1
+            return wait_time
+    
+    @property
+    def tokens_in_use(self) -> int:
+        """Requests counted against the bucket that have not yet refilled."""
+        self._refill()
+        return int(self.capacity - self.tokens)
+
+
 class LLMResponse(BaseModel):
     """Structured LLM response."""
     confidence_score: float
@@ -82,7 +135,8 @@ class LLMResponse(BaseModel):
     processing_notes: Optional[str] = None
 
 
-class EvaluationCache(BaseModel):
+@dataclass(slots=True)
+class EvaluationCache:
     """Cache for LLM evaluations."""
     pair_hash: str
     response: LLMResponse
@@ -104,7 +158,10 @@ class LLMEvaluationEngine(LoggerMixin):
         self.config = config or LLMConfig()
         self.evaluation_cache: Dict[str, EvaluationCache] = {}
         self.cost_tracker = {"total_cost": 0.0, "requests_today": 0}
-        self.rate_limiter = {"requests": [], "last_reset": datetime.utcnow()}
+        self.rate_limiter = TokenBucket(
+            rate_per_second=self.config.requests_per_minute / 60.0,
+            capacity=self.config.requests_per_minute
+        )
         
         # Initialize LLM clients
         self._initialize_clients()
@@ -133,10 +190,7 @@ class LLMEvaluationEngine(LoggerMixin):
     async def evaluate_market_pair(self, pair: MarketPair, ml_prediction: MLPrediction) -> LLMEvaluation:
         """Evaluate a single market pair using LLM."""
         
-        # Check rate limits
-        await self._check_rate_limits()
-        
-        # Check cache first
+        # Check cache first; cache hits do not count against the rate limit
         pair_hash = self._generate_pair_hash(pair)
         cached_evaluation = self._get_cached_evaluation(pair_hash)
         
@@ -144,6 +198,9 @@ class LLMEvaluationEngine(LoggerMixin):
             self.logger.debug(f"Using cached evaluation for pair {pair.kalshi_id}_{pair.polymarket_id}")
             return self._cache_to_evaluation(cached_evaluation, pair, ml_prediction)
         
+        # Check rate limits
+        await self._check_rate_limits()
+        
         # Perform LLM evaluation
         try:
             llm_response = await self._query_llm(pair, ml_prediction)
@@ -226,10 +283,6 @@ class LLMEvaluationEngine(LoggerMixin):
                     evaluations.append(result)
                 else:
                     self.logger.warning(f"Batch evaluation failed: {result}")
-            
-            # Rate limiting between batches
-            if batch_num < total_batches:
-                await asyncio.sleep(1.0)  # Brief pause between batches
         
         # Filter by confidence threshold
         high_confidence_evaluations = [
@@ -329,7 +382,7 @@ Evaluate the following prediction market pair for arbitrage potential:
 
 **ML Prediction Score:** {ml_prediction.llm_worthiness_score:.3f}
 **ML Confidence:** {ml_prediction.confidence_prediction:.3f}
-**ML Features:** {json.dumps(ml_prediction.features.dict(), indent=2)}
+**ML Features:** {orjson.dumps(ml_prediction.features.dict(), option=orjson.OPT_INDENT_2).decode()}
 
 **Evaluation Criteria:**
 1. **Semantic Similarity**: Are these markets asking about the same event/outcome?
@@ -352,18 +405,7 @@ Please provide your evaluation in the following JSON format:
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for LLM."""
-        return """
-You are an expert financial analyst specializing in prediction market arbitrage. Your task is to evaluate pairs of prediction markets from different platforms (Kalshi and Polymarket) to determine if they represent the same underlying event and offer genuine arbitrage opportunities.
-
-Key considerations:
-- Markets must be asking about the same specific event or outcome
-- Price differences must exceed transaction costs (~2-3%)
-- Markets should have sufficient liquidity
-- Time alignment is important for risk management
-- Consider regulatory and platform-specific risks
-
-Be conservative in your evaluations - only recommend pairs with very high confidence.
-"""
+        return _SYSTEM_PROMPT
     
     def _parse_llm_response(self, content: str) -> LLMResponse:
         """Parse LLM response into structured format."""
@@ -374,7 +416,7 @@ Be conservative in your evaluations - only recommend pairs with very high confid
             
             if start_idx != -1 and end_idx != -1:
                 json_str = content[start_idx:end_idx]
-                data = json.loads(json_str)
+                data = orjson.loads(json_str)
                 
                 return LLMResponse(
                     confidence_score=float(data.get('confidence_score', 0.0)),
@@ -479,29 +521,9 @@ Be conservative in your evaluations - only recommend pairs with very high confid
     
     async def _check_rate_limits(self) -> None:
         """Check and enforce rate limits."""
-        current_time = datetime.utcnow()
-        
-        # Reset rate limiter if needed
-        if (current_time - self.rate_limiter["last_reset"]).total_seconds() >= 60:
-            self.rate_limiter["requests"] = []
-            self.rate_limiter["last_reset"] = current_time
-        
-        # Remove old requests
-        cutoff_time = current_time - timedelta(minutes=1)
-        self.rate_limiter["requests"] = [
-            req_time for req_time in self.rate_limiter["requests"]
-            if req_time > cutoff_time
-        ]
-        
-        # Check if we're over the limit
-        if len(self.rate_limiter["requests"]) >= self.config.requests_per_minute:
-            wait_time = 60 - (current_time - min(self.rate_limiter["requests"])).total_seconds()
-            if wait_time > 0:
-                self.logger.info(f"Rate limit reached, waiting {wait_time:.1f} seconds")
-                await asyncio.sleep(wait_time)
-        
-        # Record this request
-        self.rate_limiter["requests"].append(current_time)
+        wait_time = await self.rate_limiter.acquire()
+        if wait_time > 0:
+            self.logger.info(f"Rate limit reached, waited {wait_time:.1f} seconds")
     
     def _estimate_openai_cost(self, response) -> float:
         """Estimate OpenAI API cost."""
@@ -527,8 +549,24 @@ Be conservative in your evaluations - only recommend pairs with very high confid
         
         return input_cost + output_cost
     
+    def purge_expired_cache(self) -> int:
+        """Drop expired evaluations in one pass, returning how many were removed."""
+        cutoff_time = datetime.utcnow() - timedelta(hours=self.config.cache_duration_hours)
+        before = len(self.evaluation_cache)
+        
+        self.evaluation_cache = {
+            pair_hash: cached for pair_hash, cached in self.evaluation_cache.items()
+            if cached.timestamp >= cutoff_time
+        }
+        
+        removed = before - len(self.evaluation_cache)
+        if removed:
+            self.logger.debug(f"Purged {removed} expired cached evaluations")
+        return removed
+    
     def get_evaluation_statistics(self) -> Dict[str, Any]:
         """Get evaluation statistics."""
+        self.purge_expired_cache()
         total_cached = len(self.evaluation_cache)
         cache_hit_rate = 0.0  # Would be calculated based on actual usage
         
@@ -541,7 +579,7 @@ Be conservative in your evaluations - only recommend pairs with very high confid
             "requests_today": self.cost_tracker["requests_today"],
             "rate_limit_status": {
                 "requests_per_minute": self.config.requests_per_minute,
-                "current_requests": len(self.rate_limiter["requests"])
+                "current_requests": self.rate_limiter.tokens_in_use
             }
         }
     
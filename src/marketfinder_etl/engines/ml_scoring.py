@@ -6,6 +6,9 @@ reducing the comparison space from 50K to ~1K pairs (98% reduction).
 """
 
 import asyncio
+import functools
+import hashlib
+import math
 import pickle
 import numpy as np
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -13,11 +16,12 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 import joblib
+import orjson
 
 from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import cross_val_score
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.metrics import precision_recall_fscore_support, roc_auc_score
 import pandas as pd
 
 from marketfinder_etl.core.logging import LoggerMixin
@@ -26,6 +30,67 @@ from marketfinder_etl.models.arbitrage import MLFeatures, MLPrediction
 from marketfinder_etl.engines.filtering import MarketPair
 
 
+FEATURE_NAMES = (
+    'jaccard_similarity', 'cosine_similarity', 'keyword_overlap_count',
+    'price_difference', 'volume_ratio', 'category_match',
+    'close_time_difference_hours', 'both_closing_soon',
+    'kalshi_liquidity_score', 'polymarket_liquidity_score',
+    'bucket_historical_success_rate', 'similar_pair_confidence'
+)
+
+
+# (estimator class, accepts learning_rate) per MLModelConfig.model_type
+_MODEL_SPECS: Dict[str, Tuple[type, bool]] = {
+    "gradient_boosting": (GradientBoostingClassifier, True),
+    "random_forest": (RandomForestClassifier, False),
+}
+
+
+def _fit_estimator(
+    estimator_cls: type,
+    hyperparameters: Tuple[Tuple[str, Any], ...],
+    X: np.ndarray,
+    y: np.ndarray
+) -> Union[GradientBoostingClassifier, RandomForestClassifier]:
+    """Build and fit an estimator; pure so joblib.Memory can cache the result."""
+    model = estimator_cls(**dict(hyperparameters))
+    model.fit(X, y)
+    return model
+
+
+# Historical success rates per bucket (placeholder until backed by data)
+_BUCKET_SUCCESS_RATES: Dict[str, float] = {
+    'politics_trump_2024': 0.85,
+    'crypto_bitcoin_price': 0.75,
+    'sports_nfl_2024': 0.70,
+    'economics_fed_rates': 0.80,
+}
+
+# Words ignored when counting keyword overlap between titles
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
+@functools.lru_cache(maxsize=65536)
+def _title_tokens(text: str) -> frozenset:
+    """Lowercased word set of a title, computed once per distinct title."""
+    return frozenset(text.lower().split())
+
+
+@functools.lru_cache(maxsize=65536)
+def _title_keywords(text: str) -> frozenset:
+    """Title words minus stop words, computed once per distinct title."""
+    return _title_tokens(text) - _STOP_WORDS
+
+
+@functools.lru_cache(maxsize=8)
+def _load_artifact(path: str, mtime_ns: int) -> Any:
+    """Deserialize a joblib artifact once per file version.
+    
+    ``mtime_ns`` is part of the cache key so a re-saved file is reloaded.
+    """
+    return joblib.load(path)
+
+
 class MLModelConfig:
     """Configuration for ML model training and inference."""
     
@@ -49,13 +114,30 @@ class MLModelConfig:
         
         # Model persistence
         self.model_save_path = Path("models")
+        self.bundle_filename = "arbitrage_ml_bundle.joblib"  # Model, scaler and metrics
+        # Separate artifacts written by earlier versions; still read when no bundle exists
         self.model_filename = "arbitrage_ml_model.joblib"
         self.scaler_filename = "feature_scaler.joblib"
+        self.metadata_filename = "model_metadata.json"
+        self.enable_fit_cache = True  # Reuse fitted estimators for identical inputs
+        self.fit_cache_bytes_limit = "1G"  # Oldest cached fits are dropped beyond this
+        self.compression = ("lz4", 3)  # Fast to decompress, much smaller on disk
         
         # Performance thresholds
         self.min_model_accuracy = 0.7
         self.prediction_threshold = 0.3
         self.high_confidence_threshold = 0.8
+        
+        # Data drift detection (PSI of recent features against training quantiles)
+        self.drift_bins = 10
+        self.drift_buffer_size = 10000
+        self.min_drift_samples = 500
+        self.drift_psi_threshold = 0.2
+    
+    @property
+    def estimator_spec(self) -> Tuple[type, bool]:
+        """Estimator class and learning_rate support; unknown types fall back to random forest."""
+        return _MODEL_SPECS.get(self.model_type, _MODEL_SPECS["random_forest"])
 
 
 class ModelMetrics:
@@ -71,7 +153,35 @@ class ModelMetrics:
         self.feature_importance: Dict[str, float] = {}
         self.training_time: float = 0.0
         self.model_version: str = "1.0"
+        self.data_hash: str = ""
         self.trained_at: datetime = datetime.utcnow()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Metrics as primitives, ready for orjson."""
+        return {
+            "accuracy": self.accuracy,
+            "precision": self.precision,
+            "recall": self.recall,
+            "f1_score": self.f1_score,
+            "roc_auc": self.roc_auc,
+            "cross_val_score": self.cross_val_score,
+            "feature_importance": self.feature_importance,
+            "training_time": self.training_time,
+            "model_version": self.model_version,
+            "data_hash": self.data_hash,
+            "trained_at": self.trained_at
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelMetrics":
+        """Rebuild metrics persisted with to_dict."""
+        metrics = cls()
+        for key, value in data.items():
+            if hasattr(metrics, key):
+                setattr(metrics, key, value)
+        if isinstance(metrics.trained_at, str):
+            metrics.trained_at = datetime.fromisoformat(metrics.trained_at)
+        return metrics
 
 
 class MLScoringEngine(LoggerMixin):
@@ -90,6 +200,28 @@ class MLScoringEngine(LoggerMixin):
         self.metrics: Optional[ModelMetrics] = None
         self.feature_names: List[str] = []
         
+        # Training runs in flight, keyed by _training_key
+        self._inflight_training: Dict[str, asyncio.Task] = {}
+        
+        # Snapshot of get_model_info() and the active model's headline metrics,
+        # refreshed only when the metrics change (see _set_metrics)
+        self._model_info: Optional[Dict[str, Any]] = None
+        self._active_model_version = "heuristic"
+        self._active_accuracy = 0.0
+        
+        # Training-set bin edges/proportions and a ring buffer of recently scored features
+        self._drift_reference: Optional[Dict[str, np.ndarray]] = None
+        self._recent_features = np.empty((self.config.drift_buffer_size, len(FEATURE_NAMES)), dtype=np.float32)
+        self._recent_pos = 0
+        self._recent_count = 0
+        
+        # Disk-backed cache of fitted estimators keyed on hyperparameters and data
+        self._fit_memory = joblib.Memory(
+            location=str(self.config.model_save_path / ".fit_cache") if self.config.enable_fit_cache else None,
+            verbose=0
+        )
+        self._cached_fit = self._fit_memory.cache(_fit_estimator)
+        
         # Load existing model if available
         self._load_model()
     
@@ -101,14 +233,63 @@ class MLScoringEngine(LoggerMixin):
         
         # Make prediction
         if self.model is None:
+            llm_worthiness_score = None
+        else:
+            # Use trained ML model
+            raw_row = self._features_to_matrix([features])
+            self._record_recent_features(raw_row)
+            feature_row = self.scaler.transform(raw_row) if self.scaler else raw_row
+            llm_worthiness_score = float(self.model.predict_proba(feature_row)[0, 1])
+        
+        return self._build_prediction(pair, features, llm_worthiness_score)
+    
+    async def score_market_pairs(self, pairs: List[MarketPair]) -> List[Tuple[MarketPair, MLPrediction]]:
+        """Score many market pairs with a single model call.
+        
+        Pairs whose features cannot be extracted are logged and skipped.
+        """
+        
+        scored_pairs: List[MarketPair] = []
+        pair_features: List[MLFeatures] = []
+        for pair in pairs:
+            try:
+                pair_features.append(self._extract_features(pair))
+                scored_pairs.append(pair)
+            except Exception as e:
+                self.logger.warning(f"ML scoring failed for pair: {e}")
+        
+        if not scored_pairs:
+            return []
+        
+        if self.model is None:
+            scores: List[Optional[float]] = [None] * len(scored_pairs)
+        else:
+            # One contiguous matrix, one scaler transform and one predict_proba call
+            X = self._features_to_matrix(pair_features)
+            self._record_recent_features(X)
+            if self.scaler:
+                X = self.scaler.transform(X)
+            scores = (await asyncio.to_thread(self.model.predict_proba, X))[:, 1].tolist()
+        
+        return [
+            (pair, self._build_prediction(pair, features, score))
+            for pair, features, score in zip(scored_pairs, pair_features, scores)
+        ]
+    
+    def _build_prediction(
+        self,
+        pair: MarketPair,
+        features: MLFeatures,
+        llm_worthiness_score: Optional[float]
+    ) -> MLPrediction:
+        """Build the prediction for a pair from its model score, or heuristics if unscored."""
+        
+        if llm_worthiness_score is None:
             # Use heuristic scoring if no model is available
             llm_worthiness_score = self._heuristic_scoring(features)
             confidence_prediction = llm_worthiness_score * 0.8  # Conservative estimate
             explanation = "Heuristic scoring (no ML model available)"
         else:
-            # Use trained ML model
-            feature_vector = self._features_to_vector(features)
-            llm_worthiness_score = float(self.model.predict_proba([feature_vector])[0][1])
             confidence_prediction = min(0.9, llm_worthiness_score + 0.1)
             explanation = self._generate_ml_explanation(features, llm_worthiness_score)
         
@@ -119,7 +300,7 @@ class MLScoringEngine(LoggerMixin):
             llm_worthiness_score=llm_worthiness_score,
             confidence_prediction=confidence_prediction,
             probability_threshold=self.config.prediction_threshold,
-            model_version=self.metrics.model_version if self.metrics else "heuristic",
+            model_version=self._active_model_version,
             features=features,
             explanation=explanation
         )
@@ -174,11 +355,11 @@ class MLScoringEngine(LoggerMixin):
             return 0.0
         
         # Simple bag-of-words cosine similarity
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        words1 = _title_tokens(text1)
+        words2 = _title_tokens(text2)
         
         # Intersection over geometric mean
-        intersection = len(words1.intersection(words2))
+        intersection = len(words1 & words2)
         if intersection == 0:
             return 0.0
         
@@ -189,15 +370,8 @@ class MLScoringEngine(LoggerMixin):
         if not text1 or not text2:
             return 0
         
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
-        return len(words1.intersection(words2))
+        # Stop words are already removed from the cached keyword sets
+        return len(_title_keywords(text1) & _title_keywords(text2))
     
     def _calculate_volume_ratio(self, volume1: Decimal, volume2: Decimal) -> float:
         """Calculate ratio of smaller to larger volume."""
@@ -229,22 +403,16 @@ class MLScoringEngine(LoggerMixin):
     def _get_bucket_success_rate(self, bucket_name: str) -> float:
         """Get historical success rate for this bucket (placeholder)."""
         # This would query historical data in a real implementation
-        bucket_rates = {
-            'politics_trump_2024': 0.85,
-            'crypto_bitcoin_price': 0.75,
-            'sports_nfl_2024': 0.70,
-            'economics_fed_rates': 0.80,
-        }
-        return bucket_rates.get(bucket_name, 0.6)  # Default 60%
+        return _BUCKET_SUCCESS_RATES.get(bucket_name, 0.6)  # Default 60%
     
     def _get_similar_pair_confidence(self, pair: MarketPair) -> float:
         """Get confidence from similar historical pairs (placeholder)."""
         # This would use similarity search on historical pairs
         return 0.7  # Default confidence
     
-    def _features_to_vector(self, features: MLFeatures) -> np.ndarray:
-        """Convert MLFeatures to numpy array for model input."""
-        feature_vector = np.array([
+    def _raw_feature_values(self, features: MLFeatures) -> Tuple[float, ...]:
+        """Unscaled feature values in FEATURE_NAMES order."""
+        return (
             features.jaccard_similarity,
             features.cosine_similarity,
             features.keyword_overlap_count,
@@ -257,13 +425,11 @@ class MLScoringEngine(LoggerMixin):
             features.polymarket_liquidity_score,
             features.bucket_historical_success_rate,
             features.similar_pair_confidence
-        ])
-        
-        # Apply scaling if available
-        if self.scaler:
-            feature_vector = self.scaler.transform([feature_vector])[0]
-        
-        return feature_vector
+        )
+    
+    def _features_to_matrix(self, features: List[MLFeatures]) -> np.ndarray:
+        """Stack unscaled feature rows into a C-contiguous float64 matrix for sklearn."""
+        return np.array([self._raw_feature_values(row) for row in features], dtype=np.float64)
     
     def _heuristic_scoring(self, features: MLFeatures) -> float:
         """Heuristic scoring when no ML model is available."""
@@ -321,58 +487,109 @@ class MLScoringEngine(LoggerMixin):
         
         # Prepare training data
         X, y = self._prepare_training_data(training_data)
+        data_hash = self._hash_training_data(X, y)
+        
+        # Identical requests that arrive while a run is in flight share its result
+        training_key = self._training_key(data_hash)
+        inflight = self._inflight_training.get(training_key)
+        if inflight is not None:
+            self.logger.info("Joining in-flight training run with identical config and data")
+            return await asyncio.shield(inflight)
+        
+        task = asyncio.create_task(self._train_on_data(X, y, data_hash, start_time))
+        self._inflight_training[training_key] = task
+        task.add_done_callback(lambda _: self._inflight_training.pop(training_key, None))
+        
+        return await asyncio.shield(task)
+    
+    def _training_key(self, data_hash: str) -> str:
+        """Canonical hash of everything that determines a training run's outcome."""
+        return hashlib.sha1(orjson.dumps({
+            "model_type": self.config.model_type,
+            "hyperparameters": self._model_hyperparameters(),
+            "test_size": self.config.test_size,
+            "feature_scaling": self.config.feature_scaling,
+            "high_confidence_threshold": self.config.high_confidence_threshold,
+            "data_hash": data_hash
+        }, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    async def _train_on_data(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        data_hash: str,
+        start_time: datetime
+    ) -> ModelMetrics:
+        """Split, fit, evaluate and save a model for prepared training data."""
         
         # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=self.config.test_size, random_state=self.config.random_state
-        )
+        X_train, X_test, y_train, y_test = self._split_data(X, y)
         
-        # Feature scaling
+        # Drift reference is built from unscaled training features
+        drift_reference = self._build_drift_reference(X_train)
+        
+        # Feature scaling; the scaler and model are swapped onto the engine together
+        # once evaluation succeeds, so concurrent scoring never mixes generations
+        scaler = None
         if self.config.feature_scaling:
-            self.scaler = StandardScaler()
-            X_train = self.scaler.fit_transform(X_train)
-            X_test = self.scaler.transform(X_test)
-        
-        # Train model
-        if self.config.model_type == "gradient_boosting":
-            self.model = GradientBoostingClassifier(
-                n_estimators=self.config.n_estimators,
-                max_depth=self.config.max_depth,
-                learning_rate=self.config.learning_rate,
-                random_state=self.config.random_state
+            scaler = StandardScaler()
+            X_train = scaler.fit_transform(X_train)
+            X_test = scaler.transform(X_test)
+        
+        estimator_cls, _ = self.config.estimator_spec
+        hyperparameters = self._model_hyperparameters()
+        
+        # Cross-validation clones its own estimators, so it does not depend on
+        # the final fit; run it in a worker thread while the model trains
+        cv_estimator = estimator_cls(**dict(hyperparameters))
+        cv_task = asyncio.create_task(
+            asyncio.to_thread(cross_val_score, cv_estimator, X_train, y_train, cv=5)
+        )
+        
+        try:
+            # Train model (served from the fit cache when inputs are unchanged); fitting
+            # and evaluation run in worker threads so the event loop stays responsive
+            model = await asyncio.to_thread(
+                self._cached_fit, estimator_cls, hyperparameters, X_train, y_train
             )
-        else:
-            self.model = RandomForestClassifier(
-                n_estimators=self.config.n_estimators,
-                max_depth=self.config.max_depth,
-                random_state=self.config.random_state
+            
+            # Evaluate model
+            y_pred_proba = (await asyncio.to_thread(model.predict_proba, X_test))[:, 1]
+            y_pred = model.classes_[(y_pred_proba > 0.5).astype(np.int8)]
+            
+            # Calculate metrics
+            metrics = ModelMetrics()
+            metrics.accuracy = float(np.mean(y_test == y_pred))
+            metrics.precision, metrics.recall, metrics.f1_score, _ = precision_recall_fscore_support(
+                y_test, y_pred, average="binary", zero_division=0
             )
+            metrics.roc_auc = roc_auc_score(y_test, y_pred_proba)
+            metrics.cross_val_score = (await cv_task).mean()
+        finally:
+            if not cv_task.done():
+                cv_task.cancel()
+                await asyncio.gather(cv_task, return_exceptions=True)
         
-        self.model.fit(X_train, y_train)
-        
-        # Evaluate model
-        y_pred = self.model.predict(X_test)
-        y_pred_proba = self.model.predict_proba(X_test)[:, 1]
-        
-        # Calculate metrics
-        metrics = ModelMetrics()
-        metrics.accuracy = accuracy_score(y_test, y_pred)
-        metrics.precision = precision_score(y_test, y_pred)
-        metrics.recall = recall_score(y_test, y_pred)
-        metrics.f1_score = f1_score(y_test, y_pred)
-        metrics.roc_auc = roc_auc_score(y_test, y_pred_proba)
-        metrics.cross_val_score = cross_val_score(self.model, X_train, y_train, cv=5).mean()
         metrics.training_time = (datetime.utcnow() - start_time).total_seconds()
+        metrics.data_hash = data_hash
         
         # Feature importance
-        if hasattr(self.model, 'feature_importances_'):
-            feature_importance = dict(zip(self.feature_names, self.model.feature_importances_))
+        if hasattr(model, 'feature_importances_'):
+            feature_importance = dict(zip(self.feature_names, model.feature_importances_))
             metrics.feature_importance = dict(sorted(feature_importance.items(), key=lambda x: x[1], reverse=True))
         
-        self.metrics = metrics
+        self.scaler, self.model = scaler, model
+        self._set_metrics(metrics)
+        self._set_drift_reference(drift_reference)
         
         # Save model
-        self._save_model()
+        await asyncio.to_thread(self._save_model)
+        
+        # Every distinct training set adds a cached fit, so trim the cache after each run
+        if self.config.enable_fit_cache:
+            await asyncio.to_thread(
+                self._fit_memory.reduce_size, bytes_limit=self.config.fit_cache_bytes_limit
+            )
         
         self.logger.info(
             f"Model training complete",
@@ -386,70 +603,219 @@ class MLScoringEngine(LoggerMixin):
         
         return metrics
     
+    def _split_data(
+        self,
+        X: np.ndarray,
+        y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Shuffle once and slice train/test sets out of the contiguous arrays."""
+        n_samples = len(X)
+        n_test = math.ceil(n_samples * self.config.test_size)
+        
+        indices = np.random.default_rng(self.config.random_state).permutation(n_samples)
+        test_idx, train_idx = indices[:n_test], indices[n_test:]
+        
+        return X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+    
+    def _model_hyperparameters(self) -> Tuple[Tuple[str, Any], ...]:
+        """Estimator keyword arguments as a sorted, hashable tuple."""
+        hyperparameters = {
+            "n_estimators": self.config.n_estimators,
+            "max_depth": self.config.max_depth,
+            "random_state": self.config.random_state
+        }
+        _, accepts_learning_rate = self.config.estimator_spec
+        if accepts_learning_rate:
+            hyperparameters["learning_rate"] = self.config.learning_rate
+        
+        return tuple(sorted(hyperparameters.items()))
+    
     def _prepare_training_data(self, training_data: List[Tuple[MarketPair, float]]) -> Tuple[np.ndarray, np.ndarray]:
         """Prepare training data for the ML model."""
-        X = []
-        y = []
+        n_samples = len(training_data)
         
-        for pair, confidence in training_data:
-            features = self._extract_features(pair)
-            feature_vector = self._features_to_vector(features)
-            
-            # Convert confidence to binary classification (high/low confidence)
-            label = 1 if confidence >= self.config.high_confidence_threshold else 0
-            
-            X.append(feature_vector)
-            y.append(label)
+        # Fill one preallocated float32 matrix with unscaled features; the
+        # scaler is fitted on the training split afterwards
+        X = np.empty((n_samples, len(FEATURE_NAMES)), dtype=np.float32)
+        confidences = np.empty(n_samples, dtype=np.float64)
+        
+        for i, (pair, confidence) in enumerate(training_data):
+            X[i] = self._raw_feature_values(self._extract_features(pair))
+            confidences[i] = confidence
+        
+        # Convert confidence to binary classification (high/low confidence)
+        y = (confidences >= self.config.high_confidence_threshold).astype(np.int8)
         
         # Store feature names
-        self.feature_names = [
-            'jaccard_similarity', 'cosine_similarity', 'keyword_overlap_count',
-            'price_difference', 'volume_ratio', 'category_match',
-            'close_time_difference_hours', 'both_closing_soon',
-            'kalshi_liquidity_score', 'polymarket_liquidity_score',
-            'bucket_historical_success_rate', 'similar_pair_confidence'
-        ]
+        self.feature_names = list(FEATURE_NAMES)
+        
+        return X, y
+    
+    def _hash_training_data(self, X: np.ndarray, y: np.ndarray) -> str:
+        """Fingerprint the training set by digesting the raw array buffers."""
+        data_hash = hashlib.md5(np.ascontiguousarray(X))
+        data_hash.update(np.ascontiguousarray(y))
+        
+        # Include the feature schema so renamed or reordered features still invalidate
+        schema_hash = hashlib.md5(",".join(self.feature_names).encode()).hexdigest()
+        data_hash.update(schema_hash.encode())
         
-        return np.array(X), np.array(y)
+        return data_hash.hexdigest()
     
     def _save_model(self) -> None:
-        """Save the trained model and scaler."""
+        """Save the trained model, scaler and metrics as a single bundle."""
         self.config.model_save_path.mkdir(exist_ok=True)
         
-        if self.model:
-            model_path = self.config.model_save_path / self.config.model_filename
-            joblib.dump(self.model, model_path)
-            self.logger.info(f"Model saved to {model_path}")
+        if not self.model:
+            return
         
-        if self.scaler:
-            scaler_path = self.config.model_save_path / self.config.scaler_filename
-            joblib.dump(self.scaler, scaler_path)
-            self.logger.info(f"Scaler saved to {scaler_path}")
+        bundle = {
+            "model": self.model,
+            "scaler": self.scaler,
+            "metrics": self.metrics.to_dict() if self.metrics else None,
+            "drift_reference": self._drift_reference
+        }
+        bundle_path = self.config.model_save_path / self.config.bundle_filename
+        joblib.dump(bundle, bundle_path, compress=self.config.compression, protocol=pickle.HIGHEST_PROTOCOL)
+        self.logger.info(f"Model bundle saved to {bundle_path}")
     
     def _load_model(self) -> None:
         """Load existing model and scaler if available."""
-        model_path = self.config.model_save_path / self.config.model_filename
-        scaler_path = self.config.model_save_path / self.config.scaler_filename
+        bundle_path = self.config.model_save_path / self.config.bundle_filename
         
         try:
-            if model_path.exists():
-                self.model = joblib.load(model_path)
-                self.logger.info(f"Model loaded from {model_path}")
-            
-            if scaler_path.exists():
-                self.scaler = joblib.load(scaler_path)
-                self.logger.info(f"Scaler loaded from {scaler_path}")
+            if bundle_path.exists():
+                # Engines sharing a model directory reuse the already deserialized bundle
+                bundle = _load_artifact(str(bundle_path), bundle_path.stat().st_mtime_ns)
+                self.model = bundle["model"]
+                self.scaler = bundle["scaler"]
+                self._set_metrics(ModelMetrics.from_dict(bundle["metrics"]) if bundle["metrics"] else None)
+                self._set_drift_reference(bundle.get("drift_reference"))
+                self.feature_names = list(FEATURE_NAMES)
+                self.logger.info(f"Model bundle loaded from {bundle_path}")
+            else:
+                self._load_legacy_artifacts()
                 
         except Exception as e:
             self.logger.warning(f"Failed to load model: {e}")
             self.model = None
             self.scaler = None
+            self._set_metrics(None)
+    
+    def _load_legacy_artifacts(self) -> None:
+        """Load a model saved as separate model, scaler and metadata files."""
+        model_path = self.config.model_save_path / self.config.model_filename
+        scaler_path = self.config.model_save_path / self.config.scaler_filename
+        metadata_path = self.config.model_save_path / self.config.metadata_filename
+        
+        if model_path.exists():
+            self.model = _load_artifact(str(model_path), model_path.stat().st_mtime_ns)
+            self.logger.info(f"Model loaded from {model_path}")
+        
+        if scaler_path.exists():
+            self.scaler = _load_artifact(str(scaler_path), scaler_path.stat().st_mtime_ns)
+            self.logger.info(f"Scaler loaded from {scaler_path}")
+        
+        if self.model and metadata_path.exists():
+            self._set_metrics(ModelMetrics.from_dict(orjson.loads(metadata_path.read_bytes())))
+            self.feature_names = list(FEATURE_NAMES)
+    
+    def _set_metrics(self, metrics: Optional[ModelMetrics]) -> None:
+        """Install the active model's metrics and refresh the values derived from them."""
+        self.metrics = metrics
+        self._model_info = None
+        self._active_model_version = metrics.model_version if metrics else "heuristic"
+        self._active_accuracy = metrics.accuracy if metrics else 0.0
+    
+    # Data drift detection
+    
+    def _build_drift_reference(self, X_train: np.ndarray) -> Dict[str, np.ndarray]:
+        """Summarize training features as per-feature quantile bin edges and proportions."""
+        inner_quantiles = np.linspace(0, 1, self.config.drift_bins + 1)[1:-1]
+        edges = np.quantile(X_train, inner_quantiles, axis=0)
+        
+        return {"edges": edges, "expected": self._bin_proportions(X_train, edges)}
+    
+    def _set_drift_reference(self, drift_reference: Optional[Dict[str, np.ndarray]]) -> None:
+        """Install a new training reference and discard samples gathered for the old one."""
+        self._drift_reference = drift_reference
+        self._recent_pos = 0
+        self._recent_count = 0
+    
+    def _bin_proportions(self, X: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """Share of rows falling into each bin, shaped (n_bins, n_features)."""
+        n_bins = edges.shape[0] + 1
+        proportions = np.empty((n_bins, X.shape[1]))
+        
+        for k in range(X.shape[1]):
+            bin_index = np.searchsorted(edges[:, k], X[:, k], side="right")
+            proportions[:, k] = np.bincount(bin_index, minlength=n_bins)
+        
+        return proportions / len(X)
+    
+    def _record_recent_features(self, X: np.ndarray) -> None:
+        """Append unscaled feature rows to the drift ring buffer."""
+        if self._drift_reference is None:
+            return
+        
+        capacity = len(self._recent_features)
+        X = X[-capacity:]
+        n_rows = len(X)
+        end = self._recent_pos + n_rows
+        
+        if end <= capacity:
+            self._recent_features[self._recent_pos:end] = X
+        else:
+            split = capacity - self._recent_pos
+            self._recent_features[self._recent_pos:] = X[:split]
+            self._recent_features[:n_rows - split] = X[split:]
+        
+        self._recent_pos = end % capacity
+        self._recent_count = min(capacity, self._recent_count + n_rows)
+    
+    def detect_data_drift(self) -> Dict[str, Any]:
+        """Compare recently scored features with the training data using PSI.
+        
+        Cost is bounded by the ring buffer size, not the training set size.
+        """
+        if self._drift_reference is None:
+            return {"status": "no_reference"}
+        
+        if self._recent_count < self.config.min_drift_samples:
+            return {"status": "insufficient_data", "samples": self._recent_count}
+        
+        recent = self._recent_features[:self._recent_count]
+        
+        # Clip empty bins so the log term stays finite
+        expected = np.clip(self._drift_reference["expected"], 1e-4, None)
+        actual = np.clip(self._bin_proportions(recent, self._drift_reference["edges"]), 1e-4, None)
+        psi = ((actual - expected) * np.log(actual / expected)).sum(axis=0)
+        
+        psi_by_feature = dict(zip(FEATURE_NAMES, psi.tolist()))
+        drifted_features = [
+            name for name, value in psi_by_feature.items()
+            if value >= self.config.drift_psi_threshold
+        ]
+        
+        return {
+            "status": "drift_detected" if drifted_features else "stable",
+            "samples": self._recent_count,
+            "psi": psi_by_feature,
+            "drifted_features": drifted_features
+        }
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model."""
         if not self.model or not self.metrics:
             return {"status": "no_model_available"}
         
+        if self._model_info is None:
+            self._model_info = self._build_model_info()
+        
+        return self._model_info
+    
+    def _build_model_info(self) -> Dict[str, Any]:
+        """Assemble the model summary returned by get_model_info."""
         return {
             "status": "model_available",
             "model_type": type(self.model).__name__,
@@ -463,7 +829,8 @@ class MLScoringEngine(LoggerMixin):
             },
             "feature_importance": self.metrics.feature_importance,
             "trained_at": self.metrics.trained_at.isoformat(),
-            "model_version": self.metrics.model_version
+            "model_version": self.metrics.model_version,
+            "data_hash": self.metrics.data_hash
         }
     
     def update_model_with_new_data(self, new_data: List[Tuple[MarketPair, float]]) -> None:
@@ -485,6 +852,4 @@ class MLScoringEngine(LoggerMixin):
     @property
     def current_model_accuracy(self) -> float:
         """Get current model accuracy."""
-        if self.metrics:
-            return self.metrics.accuracy
-        return 0.0
\ No newline at end of file
+        return self._active_accuracy
\ No newline at end of file
@@ -3,9 +3,11 @@
 from marketfinder_etl.extractors.kalshi import KalshiExtractor
 from marketfinder_etl.extractors.polymarket import PolymarketExtractor
 from marketfinder_etl.extractors.base import BaseExtractor
+from marketfinder_etl.extractors.fast_market import FastNormalizedMarket
 
 __all__ = [
     "BaseExtractor",
+    "FastNormalizedMarket",
     "KalshiExtractor", 
     "PolymarketExtractor",
 ]
\ No newline at end of file
@@ -1,17 +1,57 @@
 """Base extractor class for market data extraction."""
 
 import asyncio
+import math
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Any, Dict, List, Optional, AsyncIterator
 from datetime import datetime
+from decimal import Decimal
 import time
 
 import httpx
+import ijson
+import orjson
 from pydantic import BaseModel
 
 from marketfinder_etl.core.config import settings
 from marketfinder_etl.core.logging import LoggerMixin
-from marketfinder_etl.models.market import RawMarketData, MarketPlatform
+from marketfinder_etl.models.market import RawMarketData, MarketPlatform, NormalizedMarket
+from marketfinder_etl.extractors.fast_market import FastNormalizedMarket
+
+
+# Prices are normalized to basis points (4 decimal places)
+PRICE_SCALE = 10000
+
+
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing ``Z`` for UTC."""
+    return datetime.fromisoformat(value)
+
+
+# Interned single-tag tuples, one per (low-cardinality) category
+_CATEGORY_TAGS: Dict[str, tuple[str, ...]] = {}
+
+
+def category_tags(category: str) -> tuple[str, ...]:
+    """Get the default tags for a category, shared across markets."""
+    tags = _CATEGORY_TAGS.get(category)
+    if tags is None:
+        tags = _CATEGORY_TAGS.setdefault(category, (category.lower(),))
+    return tags
+
+
+def price_to_decimal(price: float) -> Decimal:
+    """Clamp a price to [0, 1] and convert it to a Decimal.
+    
+    Rounds to basis points and builds the Decimal from an integer, which
+    avoids the string parsing of ``Decimal(str(price))``.
+    """
+    if math.isnan(price):
+        price = 0.5
+    price = 0.0 if price < 0.0 else 1.0 if price > 1.0 else price
+    return Decimal(int(round(price * PRICE_SCALE))) / PRICE_SCALE
 
 
 class ExtractorConfig(BaseModel):
@@ -21,8 +61,62 @@ class ExtractorConfig(BaseModel):
     max_retries: int = 3
     backoff_factor: float = 2.0
     max_concurrent_requests: int = 10
+    max_keepalive_connections: Optional[int] = None  # Defaults to max_concurrent_requests
     rate_limit_per_second: float = 5.0
     user_agent: str = "MarketFinder-ETL/1.0"
+    details_cache_size: int = 4096
+    details_cache_ttl_seconds: float = 30.0
+
+
+# Keys under which list endpoints wrap their items
+_ITEM_WRAPPER_KEYS = ("data", "items", "results", "markets")
+
+# ijson prefix of a response's item array -> prefix of the items inside it
+_ITEM_ARRAY_PREFIXES = {"": "item", **{key: f"{key}.item" for key in _ITEM_WRAPPER_KEYS}}
+
+
+class _AsyncByteReader:
+    """Adapt an httpx byte stream to the async ``read`` interface ijson expects."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next chunk of the body, or ``b""`` once exhausted."""
+        # ijson probes the stream type with a zero-size read, which must not consume a chunk
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def _iter_json_items(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """Incrementally decode the objects of a JSON list response.
+    
+    Accepts a top-level array or an object wrapping the array under one of
+    ``_ITEM_WRAPPER_KEYS``; any other shape raises ValueError.
+    """
+    item_prefix: Optional[str] = None
+    builder: Optional[ijson.ObjectBuilder] = None
+    
+    async for prefix, event, value in ijson.parse(_AsyncByteReader(chunks), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            # Nested objects end under longer prefixes, so this closes the item itself
+            if event == "end_map" and prefix == item_prefix:
+                yield builder.value
+                builder = None
+        elif item_prefix is None:
+            if event == "start_array" and prefix in _ITEM_ARRAY_PREFIXES:
+                item_prefix = _ITEM_ARRAY_PREFIXES[prefix]
+        elif event == "start_map" and prefix == item_prefix:
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+    
+    if item_prefix is None:
+        raise ValueError(
+            "Unrecognized response format: expected a JSON array or an object "
+            f"with one of {', '.join(_ITEM_WRAPPER_KEYS)}"
+        )
 
 
 class RateLimiter:
@@ -52,6 +146,7 @@ class BaseExtractor(LoggerMixin, ABC):
         self.config = config or ExtractorConfig()
         self.rate_limiter = RateLimiter(self.config.rate_limit_per_second)
         self._session: Optional[httpx.AsyncClient] = None
+        self._details_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
     
     @property
     def session(self) -> httpx.AsyncClient:
@@ -63,9 +158,15 @@ class BaseExtractor(LoggerMixin, ABC):
                     "User-Agent": self.config.user_agent,
                     **self.get_auth_headers()
                 },
+                # Keep as many idle connections as may be in use at once, so
+                # bursts of concurrent requests do not churn TLS handshakes
                 limits=httpx.Limits(
                     max_connections=self.config.max_concurrent_requests,
-                    max_keepalive_connections=5
+                    max_keepalive_connections=(
+                        self.config.max_keepalive_connections
+                        if self.config.max_keepalive_connections is not None
+                        else self.config.max_concurrent_requests
+                    )
                 )
             )
         return self._session
@@ -104,6 +205,49 @@ class BaseExtractor(LoggerMixin, ABC):
         """Extract market data from the platform."""
         pass
     
+    @abstractmethod
+    def transform_to_fast_market(
+        self,
+        raw_market: RawMarketData,
+        now: Optional[datetime] = None
+    ) -> FastNormalizedMarket:
+        """Transform raw market data to the lightweight normalized struct."""
+        pass
+    
+    def transform_to_normalized_market(
+        self,
+        raw_market: RawMarketData,
+        now: Optional[datetime] = None
+    ) -> NormalizedMarket:
+        """Transform raw market data to the validated normalized model."""
+        return self.transform_to_fast_market(raw_market, now=now).to_normalized_market()
+    
+    def get_cached_market_details(self, market_id: str) -> Optional[Dict[str, Any]]:
+        """Get market details cached by a recent lookup, if still fresh."""
+        entry = self._details_cache.get(market_id)
+        if entry is None:
+            return None
+        
+        cached_at, details = entry
+        if time.monotonic() - cached_at > self.config.details_cache_ttl_seconds:
+            del self._details_cache[market_id]
+            return None
+        
+        self._details_cache.move_to_end(market_id)
+        return details
+    
+    def cache_market_details(self, market_id: str, details: Dict[str, Any]) -> None:
+        """Cache market details, evicting the least recently used entry when full."""
+        self._details_cache[market_id] = (time.monotonic(), details)
+        self._details_cache.move_to_end(market_id)
+        
+        if len(self._details_cache) > self.config.details_cache_size:
+            self._details_cache.popitem(last=False)
+    
+    def clear_market_details_cache(self) -> None:
+        """Drop all cached market details."""
+        self._details_cache.clear()
+    
     async def make_request(
         self,
         method: str,
@@ -127,136 +271,100 @@ class BaseExtractor(LoggerMixin, ABC):
                 response = await self.session.request(method, full_url, **kwargs)
                 response.raise_for_status()
                 
-                return response.json()
-                
-            except httpx.HTTPStatusError as e:
-                self.logger.warning(
-                    "HTTP error in API request",
-                    status_code=e.response.status_code,
-                    url=full_url,
-                    attempt=attempt + 1
-                )
-                
-                # Don't retry on client errors (4xx)
-                if 400 <= e.response.status_code < 500:
-                    raise
-                
-                if attempt == self.config.max_retries:
-                    raise
-                
-                # Exponential backoff
-                wait_time = self.config.backoff_factor ** attempt
-                await asyncio.sleep(wait_time)
+                return orjson.loads(response.content)
                 
             except Exception as e:
-                self.logger.error(
-                    "Request failed",
-                    error=str(e),
-                    url=full_url,
-                    attempt=attempt + 1
-                )
-                
-                if attempt == self.config.max_retries:
+                if not self._should_retry(e, full_url, attempt):
                     raise
                 
-                wait_time = self.config.backoff_factor ** attempt
-                await asyncio.sleep(wait_time)
+                # Exponential backoff
+                await asyncio.sleep(self.config.backoff_factor ** attempt)
     
-    async def extract_paginated(
+    def _should_retry(self, error: Exception, url: str, attempt: int) -> bool:
+        """Log a failed request attempt and decide whether to retry it."""
+        if isinstance(error, httpx.HTTPStatusError):
+            self.logger.warning(
+                "HTTP error in API request",
+                status_code=error.response.status_code,
+                url=url,
+                attempt=attempt + 1
+            )
+            
+            # Don't retry on client errors (4xx)
+            if 400 <= error.response.status_code < 500:
+                return False
+        else:
+            self.logger.error(
+                "Request failed",
+                error=str(error),
+                url=url,
+                attempt=attempt + 1
+            )
+        
+        return attempt < self.config.max_retries
+    
+    async def stream_items(
         self,
-        endpoint: str,
-        page_param: str = "page",
-        limit_param: str = "limit",
-        page_size: int = 100,
-        max_pages: Optional[int] = None,
+        method: str,
+        url: str,
         **kwargs: Any
-    ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Extract data from paginated endpoints."""
-        page = 1
-        total_items = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the items of a JSON list response as they are decoded.
         
-        while True:
-            if max_pages and page > max_pages:
-                self.logger.info(f"Reached max pages limit: {max_pages}")
-                break
-            
-            params = {
-                page_param: page,
-                limit_param: page_size,
-                **kwargs.get("params", {})
-            }
-            
+        The body is parsed incrementally with ijson instead of being buffered
+        in full, so callers can process items while the rest of the page is
+        still arriving. Items may sit in a top-level array or under one of the
+        ``_ITEM_WRAPPER_KEYS`` wrapper keys; any other shape raises ValueError.
+        
+        Failures before the first item are retried with the same rate limiting
+        and backoff as ``make_request``. Later failures are raised, since a
+        retry would repeat items that were already yielded.
+        """
+        await self.rate_limiter.acquire()
+        
+        full_url = f"{self.get_base_url().rstrip('/')}/{url.lstrip('/')}"
+        
+        for attempt in range(self.config.max_retries + 1):
+            yielded = False
             try:
-                data = await self.make_request(
-                    "GET",
-                    endpoint,
-                    params=params,
-                    **{k: v for k, v in kwargs.items() if k != "params"}
-                )
-                
-                # Extract items from response
-                items = self.extract_items_from_response(data)
-                
-                if not items:
-                    self.logger.info(f"No more items on page {page}")
-                    break
-                
-                total_items += len(items)
                 self.logger.debug(
-                    "Extracted page",
-                    page=page,
-                    items_on_page=len(items),
-                    total_items=total_items
+                    "Streaming API request",
+                    method=method,
+                    url=full_url,
+                    attempt=attempt + 1
                 )
                 
-                yield data
-                
-                # Check if we have more pages
-                if not self.has_more_pages(data, len(items), page_size):
-                    break
+                async with self.session.stream(method, full_url, **kwargs) as response:
+                    response.raise_for_status()
+                    
+                    async with aclosing(_iter_json_items(response.aiter_bytes())) as items:
+                        async for item in items:
+                            yielded = True
+                            yield item
+                return
                 
-                page += 1
-                
-            except Exception as e:
-                self.logger.error(f"Failed to extract page {page}: {e}")
+            except ValueError:
                 raise
-        
-        self.logger.info(f"Extraction complete: {total_items} total items from {page-1} pages")
-    
-    def extract_items_from_response(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract items from API response. Override in subclasses."""
-        # Default implementation assumes items are at the root
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            # Common patterns
-            for key in ["data", "items", "results", "markets"]:
-                if key in response:
-                    return response[key]
-        return []
-    
-    def has_more_pages(
-        self,
-        response: Dict[str, Any],
-        items_count: int,
-        page_size: int
-    ) -> bool:
-        """Check if there are more pages to fetch. Override in subclasses."""
-        # Default implementation: if we got fewer items than page size, we're done
-        return items_count == page_size
+            except Exception as e:
+                if yielded or not self._should_retry(e, full_url, attempt):
+                    raise
+                
+                # Exponential backoff
+                await asyncio.sleep(self.config.backoff_factor ** attempt)
     
     def create_raw_market_data(
         self,
         external_id: str,
         raw_data: Dict[str, Any],
-        api_endpoint: Optional[str] = None
+        api_endpoint: Optional[str] = None,
+        extracted_at: Optional[datetime] = None
     ) -> RawMarketData:
         """Create RawMarketData instance."""
         return RawMarketData(
             platform=self.get_platform(),
             external_id=external_id,
             raw_data=raw_data,
-            extracted_at=datetime.utcnow(),
+            extracted_at=extracted_at or datetime.utcnow(),
             api_endpoint=api_endpoint
         )
     
@@ -0,0 +1,75 @@
+"""Lightweight market structs for the extractor transform hot path.
+
+Constructing a pydantic ``NormalizedMarket`` per market dominates the cost
+of large batch transforms. The extractors build these ``msgspec`` structs
+instead and only convert to the pydantic models at API boundaries.
+"""
+
+from typing import List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+
+import msgspec
+
+from marketfinder_etl.models.market import (
+    MarketEventType,
+    MarketOutcome,
+    MarketPlatform,
+    MarketStatus,
+    NormalizedMarket,
+)
+
+
+class FastMarketOutcome(msgspec.Struct):
+    """Outcome of a market with its current price."""
+    
+    name: str
+    price: Decimal
+    
+    def to_market_outcome(self) -> MarketOutcome:
+        """Convert to the pydantic MarketOutcome model."""
+        return MarketOutcome(name=self.name, price=self.price)
+
+
+class FastNormalizedMarket(msgspec.Struct, kw_only=True):
+    """Normalized market mirroring the fields set by the extractors."""
+    
+    platform: MarketPlatform
+    external_id: str
+    title: str
+    description: str
+    category: str
+    tags: Tuple[str, ...]
+    event_type: MarketEventType
+    outcomes: List[FastMarketOutcome]
+    created_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    volume: Decimal = Decimal("0")
+    liquidity: Decimal = Decimal("0")
+    status: MarketStatus = MarketStatus.ACTIVE
+    is_active: bool = True
+    processed_at: Optional[datetime] = None
+    
+    def to_normalized_market(self) -> NormalizedMarket:
+        """Convert to the validated pydantic NormalizedMarket model."""
+        return NormalizedMarket(
+            platform=self.platform,
+            external_id=self.external_id,
+            title=self.title,
+            description=self.description,
+            category=self.category,
+            tags=list(self.tags),
+            event_type=self.event_type,
+            outcomes=[outcome.to_market_outcome() for outcome in self.outcomes],
+            created_date=self.created_date,
+            end_date=self.end_date,
+            volume=self.volume,
+            liquidity=self.liquidity,
+            status=self.status,
+            is_active=self.is_active,
+            processed_at=self.processed_at
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to a plain dict for downstream sinks."""
+        return msgspec.to_builtins(self)
@@ -5,11 +5,56 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 from decimal import Decimal
 
-from marketfinder_etl.extractors.base import BaseExtractor, ExtractorConfig
-from marketfinder_etl.models.market import RawMarketData, MarketPlatform, MarketOutcome, NormalizedMarket, MarketStatus, MarketEventType
+from marketfinder_etl.extractors.base import (
+    BaseExtractor,
+    ExtractorConfig,
+    category_tags,
+    parse_iso_timestamp,
+    price_to_decimal,
+)
+from marketfinder_etl.extractors.fast_market import FastMarketOutcome, FastNormalizedMarket
+from marketfinder_etl.models.market import RawMarketData, MarketPlatform, MarketStatus, MarketEventType
 from marketfinder_etl.core.config import settings
 
 
+KALSHI_PAGE_SIZE = 1000
+
+_ACTIVE_STATUSES = frozenset({"active", "initialized"})
+
+# Price fields Kalshi might use, in priority order
+_YES_PRICE_KEYS = ("yes_ask", "yes_price", "last_price")
+_NO_PRICE_KEYS = ("no_ask", "no_price")
+_IMPLIED_YES_PRICE_KEYS = ("yes_ask", "yes_price")
+
+
+def _first_price(market: Dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the first populated price field among keys, or None."""
+    for key in keys:
+        value = market.get(key)
+        if value:
+            return value
+    return None
+
+
+# Mapping of Kalshi categories to standardized names
+_CATEGORY_MAPPING = {
+    "Economics": "Economics",
+    "Politics": "Politics", 
+    "Elections": "Politics",
+    "Weather": "Weather",
+    "Sports": "Sports",
+    "Entertainment": "Entertainment",
+    "Technology": "Technology",
+    "Science": "Science",
+    "Business": "Business",
+    "Crypto": "Cryptocurrency",
+    "Cryptocurrency": "Cryptocurrency",
+}
+_CANONICAL_CATEGORIES = frozenset(
+    name for name, standardized in _CATEGORY_MAPPING.items() if name == standardized
+)
+
+
 class KalshiExtractor(BaseExtractor):
     """Extractor for Kalshi prediction markets."""
     
@@ -45,19 +90,60 @@ class KalshiExtractor(BaseExtractor):
         self.logger.info("Starting Kalshi market extraction")
         
         try:
-            # Fetch markets from the markets endpoint
-            response = await self.make_request("GET", "markets")
-            
-            # Handle response format
-            all_markets = response.get("markets", response if isinstance(response, list) else [])
+            active_markets: List[Dict[str, Any]] = []
+            total_count = 0
+            page_count = 0
+            cursor: Optional[str] = None
+            filter_task: Optional[asyncio.Task[List[Dict[str, Any]]]] = None
             
-            if not isinstance(all_markets, list):
-                raise ValueError("Invalid Kalshi API response format")
-            
-            self.logger.info(f"Kalshi returned {len(all_markets)} total markets")
+            try:
+                while True:
+                    params: Dict[str, Any] = {"limit": KALSHI_PAGE_SIZE, "status": "open"}
+                    if cursor:
+                        params["cursor"] = cursor
+                    
+                    # Fetch the next page while the previous one is still being filtered
+                    response = await self.make_request("GET", "markets", params=params)
+                    
+                    # Handle response format
+                    if isinstance(response, list):
+                        page, cursor = response, None
+                    else:
+                        page, cursor = response.get("markets", []), response.get("cursor")
+                    
+                    if not isinstance(page, list):
+                        raise ValueError("Invalid Kalshi API response format")
+                    
+                    if filter_task is not None:
+                        active_markets.extend(await filter_task)
+                        filter_task = None
+                    
+                    total_count += len(page)
+                    page_count += 1
+                    filter_task = asyncio.create_task(
+                        asyncio.to_thread(self._filter_active_markets, page)
+                    )
+                    
+                    if not cursor or not page:
+                        break
+                    
+                    # The page in flight may reach the limit; count it before fetching another
+                    if max_markets and len(active_markets) + len(page) >= max_markets:
+                        active_markets.extend(await filter_task)
+                        filter_task = None
+                        if len(active_markets) >= max_markets:
+                            break
+                
+                if filter_task is not None:
+                    active_markets.extend(await filter_task)
+                    filter_task = None
+            finally:
+                # Don't leave a filter running when a request fails mid-pagination
+                if filter_task is not None:
+                    filter_task.cancel()
+                    await asyncio.gather(filter_task, return_exceptions=True)
             
-            # Filter for active markets
-            active_markets = self._filter_active_markets(all_markets)
+            self.logger.info(f"Kalshi returned {total_count} total markets across {page_count} pages")
             self.logger.info(f"Filtered to {len(active_markets)} active Kalshi markets")
             
             # Apply limit if specified
@@ -67,6 +153,7 @@ class KalshiExtractor(BaseExtractor):
             
             # Create RawMarketData instances
             raw_markets = []
+            extracted_at = datetime.utcnow()
             for market in active_markets:
                 try:
                     external_id = market.get("ticker") or market.get("id")
@@ -77,7 +164,8 @@ class KalshiExtractor(BaseExtractor):
                     raw_market = self.create_raw_market_data(
                         external_id=external_id,
                         raw_data=market,
-                        api_endpoint="markets"
+                        api_endpoint="markets",
+                        extracted_at=extracted_at
                     )
                     raw_markets.append(raw_market)
                     
@@ -94,60 +182,29 @@ class KalshiExtractor(BaseExtractor):
     
     def _filter_active_markets(self, markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter for active, valid markets."""
-        active_markets = []
-        current_time = datetime.utcnow().isoformat()
-        
-        for market in markets:
-            try:
-                # Check if market is still open
-                close_time = market.get("close_time")
-                if not close_time or close_time <= current_time:
-                    continue
-                
-                # Check market status
-                status = market.get("status")
-                if status not in ["active", "initialized"]:
-                    continue
-                
-                # Ensure we have a valid identifier
-                if not market.get("ticker") and not market.get("id"):
-                    continue
-                
-                # Ensure we have basic market information
-                if not market.get("title"):
-                    continue
-                
-                active_markets.append(market)
-                
-            except Exception as e:
-                self.logger.warning(f"Error filtering market: {e}", market_id=market.get("ticker"))
-                continue
+        # ISO-8601 timestamps sort lexicographically, so compare as strings
+        now_iso = datetime.utcnow().isoformat()
         
-        return active_markets
+        return [
+            market for market in markets
+            if isinstance(close_time := market.get("close_time"), str) and close_time > now_iso
+            and market.get("status") in _ACTIVE_STATUSES
+            and (market.get("ticker") or market.get("id"))
+            and market.get("title")
+        ]
     
     def standardize_category(self, category: Optional[str]) -> str:
         """Standardize Kalshi category names."""
         if not category:
             return "Other"
         
-        # Mapping of Kalshi categories to standardized names
-        category_mapping = {
-            "Economics": "Economics",
-            "Politics": "Politics", 
-            "Elections": "Politics",
-            "Weather": "Weather",
-            "Sports": "Sports",
-            "Entertainment": "Entertainment",
-            "Technology": "Technology",
-            "Science": "Science",
-            "Business": "Business",
-            "Crypto": "Cryptocurrency",
-            "Cryptocurrency": "Cryptocurrency",
-        }
+        # Canonical names map to themselves, so skip cleaning them
+        if category in _CANONICAL_CATEGORIES:
+            return category
         
         # Clean and standardize
         clean_category = category.strip().title()
-        return category_mapping.get(clean_category, "Other")
+        return _CATEGORY_MAPPING.get(clean_category, "Other")
     
     def categorize_from_title(self, title: str) -> str:
         """Categorize market based on title keywords."""
@@ -174,44 +231,61 @@ class KalshiExtractor(BaseExtractor):
         else:
             return "Other"
     
-    def calculate_price(self, market: Dict[str, Any], outcome: str) -> Decimal:
-        """Calculate price for a specific outcome."""
+    def _raw_price(self, market: Dict[str, Any], outcome: str) -> float:
+        """Look up the unclamped price for an outcome."""
         try:
-            if outcome.lower() == "yes":
-                # Try different price fields Kalshi might use
-                price = (
-                    market.get("yes_ask") or
-                    market.get("yes_price") or
-                    market.get("last_price") or
-                    0.5  # Default to 50% if no price available
-                )
+            if outcome[:1] in ("y", "Y"):
+                # Default to 50% if no price available
+                price = _first_price(market, _YES_PRICE_KEYS) or 0.5
             else:  # "no"
                 price = (
-                    market.get("no_ask") or
-                    market.get("no_price") or
-                    (1.0 - (market.get("yes_ask") or market.get("yes_price") or 0.5))
+                    _first_price(market, _NO_PRICE_KEYS) or
+                    (1.0 - (_first_price(market, _IMPLIED_YES_PRICE_KEYS) or 0.5))
                 )
             
-            # Ensure price is between 0 and 1
-            price = max(0.0, min(1.0, float(price)))
-            return Decimal(str(price))
+            return float(price)
             
         except (ValueError, TypeError):
             # Default to 50% if calculation fails
-            return Decimal("0.5")
+            return 0.5
     
-    async def extract_market_details(self, market_id: str) -> Optional[Dict[str, Any]]:
-        """Extract detailed information for a specific market."""
+    def calculate_price(self, market: Dict[str, Any], outcome: str) -> Decimal:
+        """Calculate price for a specific outcome."""
+        return price_to_decimal(self._raw_price(market, outcome))
+    
+    async def extract_market_details(
+        self,
+        market_id: str,
+        *,
+        force: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Extract detailed information for a specific market.
+        
+        Recent lookups are served from a short-lived cache; pass ``force=True``
+        to always refetch.
+        """
+        if not force:
+            cached = self.get_cached_market_details(market_id)
+            if cached is not None:
+                return cached
+        
         try:
             response = await self.make_request("GET", f"markets/{market_id}")
-            return response.get("market", response)
+            details = response.get("market", response)
+            self.cache_market_details(market_id, details)
+            return details
         except Exception as e:
             self.logger.error(f"Failed to extract details for market {market_id}: {e}")
             return None
     
-    def transform_to_normalized_market(self, raw_market: RawMarketData) -> NormalizedMarket:
+    def transform_to_fast_market(
+        self,
+        raw_market: RawMarketData,
+        now: Optional[datetime] = None
+    ) -> FastNormalizedMarket:
         """Transform raw Kalshi market data to normalized format."""
         market_data = raw_market.raw_data
+        now = now or datetime.utcnow()
         
         # Extract basic information
         external_id = raw_market.external_id
@@ -224,28 +298,28 @@ class KalshiExtractor(BaseExtractor):
         no_price = self.calculate_price(market_data, "no")
         
         outcomes = [
-            MarketOutcome(name="Yes", price=yes_price),
-            MarketOutcome(name="No", price=no_price)
+            FastMarketOutcome(name="Yes", price=yes_price),
+            FastMarketOutcome(name="No", price=no_price)
         ]
         
         # Extract timing information
-        end_date = datetime.fromisoformat(market_data["close_time"].replace("Z", "+00:00"))
+        end_date = parse_iso_timestamp(market_data["close_time"])
         created_date = None
         if market_data.get("created_time"):
-            created_date = datetime.fromisoformat(market_data["created_time"].replace("Z", "+00:00"))
+            created_date = parse_iso_timestamp(market_data["created_time"])
         
         # Calculate volume and liquidity
         # Kalshi doesn't provide volume directly, use liquidity/open_interest as proxy
         liquidity = Decimal(str(market_data.get("liquidity", 0)))
         volume = liquidity / Decimal("1000")  # Scale liquidity to volume-like range
         
-        return NormalizedMarket(
+        return FastNormalizedMarket(
             platform=self.platform,
             external_id=external_id,
             title=title,
             description=description,
             category=category,
-            tags=[category.lower()],
+            tags=category_tags(category),
             event_type=MarketEventType.BINARY,
             outcomes=outcomes,
             created_date=created_date,
@@ -254,5 +328,5 @@ class KalshiExtractor(BaseExtractor):
             liquidity=liquidity,
             status=MarketStatus.ACTIVE,
             is_active=True,
-            processed_at=datetime.utcnow()
+            processed_at=now
         )
\ No newline at end of file
@@ -1,16 +1,65 @@
 """Polymarket data extractor."""
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional, AsyncGenerator
-from datetime import datetime
+import functools
+from contextlib import aclosing
+from typing import Any, Dict, List, Optional, AsyncGenerator, AsyncIterator
+from datetime import datetime, timedelta
 from decimal import Decimal
 
-from marketfinder_etl.extractors.base import BaseExtractor, ExtractorConfig
-from marketfinder_etl.models.market import RawMarketData, MarketPlatform, MarketOutcome, NormalizedMarket, MarketStatus, MarketEventType
+import orjson
+
+from marketfinder_etl.extractors.base import (
+    BaseExtractor,
+    ExtractorConfig,
+    category_tags,
+    parse_iso_timestamp,
+    price_to_decimal,
+)
+from marketfinder_etl.extractors.fast_market import FastMarketOutcome, FastNormalizedMarket
+from marketfinder_etl.models.market import RawMarketData, MarketPlatform, MarketStatus, MarketEventType
 from marketfinder_etl.core.config import settings
 
 
+_YES_OUTCOME_NAMES = frozenset({"yes", "true", "1"})
+
+# End date assumed for markets without a parseable one; a fixed span stays valid on Feb 29
+_DEFAULT_MARKET_LIFETIME = timedelta(days=365)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_outcomes(outcomes: str) -> Optional[tuple]:
+    """Decode a JSON-string outcomes array; few distinct strings occur, so memoize."""
+    # Only a JSON array can hold valid outcomes, so skip decoding anything else
+    if not outcomes.startswith("["):
+        return None
+    
+    try:
+        parsed = orjson.loads(outcomes)
+    except orjson.JSONDecodeError:
+        return None
+    
+    return tuple(parsed) if isinstance(parsed, list) else None
+
+
+# Mapping of Polymarket categories to standardized names
+_CATEGORY_MAPPING = {
+    "Politics": "Politics",
+    "Crypto": "Cryptocurrency", 
+    "Economics": "Economics",
+    "Sports": "Sports",
+    "Pop Culture": "Entertainment",
+    "Business": "Business",
+    "Science": "Science",
+    "Technology": "Technology",
+    "Gaming": "Entertainment",
+    "Other": "Other",
+}
+_CANONICAL_CATEGORIES = frozenset(
+    name for name, standardized in _CATEGORY_MAPPING.items() if name == standardized
+)
+
+
 class PolymarketExtractor(BaseExtractor):
     """Extractor for Polymarket prediction markets."""
     
@@ -44,60 +93,7 @@ class PolymarketExtractor(BaseExtractor):
         self.logger.info("Starting Polymarket market extraction")
         
         try:
-            all_markets = []
-            limit = 100
-            max_batches = (max_markets // limit + 1) if max_markets else None
-            batch_count = 0
-            
-            async for response in self.extract_paginated(
-                endpoint="markets",
-                page_param="offset",
-                limit_param="limit",
-                page_size=limit,
-                max_pages=max_batches,
-                params={
-                    "active": "true",
-                    "archived": "false", 
-                    "order": "startDate",
-                    "ascending": "false"
-                }
-            ):
-                markets = self.extract_items_from_response(response)
-                all_markets.extend(markets)
-                batch_count += 1
-                
-                self.logger.debug(f"Batch {batch_count}: fetched {len(markets)} markets")
-                
-                # Check if we've reached the max markets limit
-                if max_markets and len(all_markets) >= max_markets:
-                    all_markets = all_markets[:max_markets]
-                    break
-            
-            self.logger.info(f"Polymarket returned {len(all_markets)} total markets across {batch_count} batches")
-            
-            # Filter for valid binary markets
-            binary_markets = self._filter_binary_markets(all_markets)
-            self.logger.info(f"Filtered to {len(binary_markets)} active binary Polymarket markets")
-            
-            # Create RawMarketData instances
-            raw_markets = []
-            for market in binary_markets:
-                try:
-                    external_id = market.get("id") or market.get("conditionId")
-                    if not external_id:
-                        self.logger.warning("Skipping market without identifier", market=market)
-                        continue
-                    
-                    raw_market = self.create_raw_market_data(
-                        external_id=str(external_id),
-                        raw_data=market,
-                        api_endpoint="markets"
-                    )
-                    raw_markets.append(raw_market)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to process market {market.get('id', 'unknown')}: {e}")
-                    continue
+            raw_markets = [raw_market async for raw_market in self.iter_markets(max_markets)]
             
             self.logger.info(f"Successfully extracted {len(raw_markets)} Polymarket markets")
             return raw_markets
@@ -106,68 +102,124 @@ class PolymarketExtractor(BaseExtractor):
             self.logger.error(f"Failed to extract Polymarket markets: {e}")
             raise
     
-    def extract_items_from_response(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract markets from Polymarket API response."""
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            return response.get("markets", response.get("data", []))
-        return []
+    async def iter_markets(self, max_markets: Optional[int] = None) -> AsyncIterator[RawMarketData]:
+        """Stream valid binary markets as they arrive.
+        
+        Each page body is decoded incrementally and every market is filtered
+        and wrapped as soon as it is parsed, so no full page of raw API items
+        is ever held in memory.
+        """
+        limit = 100
+        offset = 0
+        batch_count = 0
+        fetched_count = 0
+        extracted_at = datetime.utcnow()
+        params = {
+            "active": "true",
+            "archived": "false", 
+            "order": "startDate",
+            "ascending": "false",
+            "limit": limit,
+        }
+        
+        while True:
+            page_count = 0
+            binary_count = 0
+            
+            async with aclosing(self.stream_items(
+                "GET",
+                "markets",
+                params={**params, "offset": offset}
+            )) as markets:
+                async for market in markets:
+                    page_count += 1
+                    fetched_count += 1
+                    
+                    if self._is_binary_market(market):
+                        binary_count += 1
+                        raw_market = self._create_raw_market(market, extracted_at)
+                        if raw_market is not None:
+                            yield raw_market
+                    
+                    # Check if we've reached the max markets limit
+                    if max_markets and fetched_count >= max_markets:
+                        break
+            
+            batch_count += 1
+            self.logger.debug(
+                f"Batch {batch_count}: fetched {page_count} markets, "
+                f"{binary_count} active binary"
+            )
+            
+            # A short page means there are no more markets
+            if page_count < limit or (max_markets and fetched_count >= max_markets):
+                break
+            
+            offset += limit
+        
+        self.logger.info(f"Polymarket returned {fetched_count} total markets across {batch_count} batches")
     
-    def has_more_pages(self, response: Dict[str, Any], items_count: int, page_size: int) -> bool:
-        """Check if there are more pages for Polymarket."""
-        # If we got fewer items than page size, we're done
-        return items_count == page_size
+    def _create_raw_market(
+        self,
+        market: Dict[str, Any],
+        extracted_at: datetime
+    ) -> Optional[RawMarketData]:
+        """Wrap a filtered Polymarket market, skipping it if it cannot be processed."""
+        try:
+            external_id = market.get("id") or market.get("conditionId")
+            if not external_id:
+                self.logger.warning("Skipping market without identifier", market=market)
+                return None
+            
+            return self.create_raw_market_data(
+                external_id=str(external_id),
+                raw_data=market,
+                api_endpoint="markets",
+                extracted_at=extracted_at
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to process market {market.get('id', 'unknown')}: {e}")
+            return None
     
-    def _filter_binary_markets(self, markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter for valid binary markets."""
-        binary_markets = []
+    def _is_binary_market(self, market: Dict[str, Any]) -> bool:
+        """Check required fields, valid binary outcomes and pricing data."""
+        return bool(
+            market.get("id") and market.get("question")
+            and self._has_valid_binary_outcomes(market)
+            and self._has_pricing_data(market)
+        )
+    
+    def _load_outcomes(self, market: Dict[str, Any]) -> Any:
+        """Return the market's outcomes, decoding a JSON string via a shared memo.
         
-        for market in markets:
-            try:
-                # Check required fields
-                if not market.get("id") or not market.get("question"):
-                    continue
-                
-                # Check for valid outcomes
-                if not self._has_valid_binary_outcomes(market):
-                    continue
-                
-                # Check if market has pricing data
-                if not self._has_pricing_data(market):
-                    continue
-                
-                binary_markets.append(market)
-                
-            except Exception as e:
-                self.logger.warning(f"Error filtering market: {e}", market_id=market.get("id"))
-                continue
+        The raw market dict is left untouched, since it is persisted as-is.
+        """
+        outcomes = market.get("outcomes")
+        if not isinstance(outcomes, str):
+            return outcomes
         
-        return binary_markets
+        parsed = _decode_outcomes(outcomes)
+        if parsed is None and outcomes.startswith("["):
+            self.logger.debug("Failed to decode outcomes", market_id=market.get("id"))
+        return parsed
     
     def _has_valid_binary_outcomes(self, market: Dict[str, Any]) -> bool:
         """Check if market has valid binary outcomes."""
-        outcomes = market.get("outcomes")
+        outcomes = self._load_outcomes(market)
         
         if not outcomes:
             return False
         
-        # Parse outcomes if they're a JSON string
-        if isinstance(outcomes, str):
-            try:
-                outcomes = json.loads(outcomes)
-            except (json.JSONDecodeError, TypeError):
-                return False
-        
         # Check if outcomes is a list with at least 2 items
-        if not isinstance(outcomes, list) or len(outcomes) < 2:
+        if not isinstance(outcomes, (list, tuple)) or len(outcomes) < 2:
             return False
         
-        # Check for Yes/No pattern
-        outcome_names = [str(o).lower() for o in outcomes if o]
-        has_yes_no = any(name in ["yes", "true", "1"] for name in outcome_names)
+        # Exactly two outcomes is binary; otherwise look for a Yes/No pattern
+        if len(outcomes) == 2:
+            return True
         
-        return has_yes_no or len(outcomes) == 2
+        return not _YES_OUTCOME_NAMES.isdisjoint(str(o).lower() for o in outcomes if o)
     
     def _has_pricing_data(self, market: Dict[str, Any]) -> bool:
         """Check if market has pricing data available."""
@@ -181,23 +233,13 @@ class PolymarketExtractor(BaseExtractor):
         if not category:
             return "Other"
         
-        # Mapping of Polymarket categories to standardized names
-        category_mapping = {
-            "Politics": "Politics",
-            "Crypto": "Cryptocurrency", 
-            "Economics": "Economics",
-            "Sports": "Sports",
-            "Pop Culture": "Entertainment",
-            "Business": "Business",
-            "Science": "Science",
-            "Technology": "Technology",
-            "Gaming": "Entertainment",
-            "Other": "Other",
-        }
+        # Canonical names map to themselves, so skip cleaning them
+        if category in _CANONICAL_CATEGORIES:
+            return category
         
         # Clean and standardize
         clean_category = category.strip()
-        return category_mapping.get(clean_category, "Other")
+        return _CATEGORY_MAPPING.get(clean_category, "Other")
     
     def categorize_from_question(self, question: str) -> str:
         """Categorize market based on question keywords."""
@@ -222,63 +264,70 @@ class PolymarketExtractor(BaseExtractor):
         else:
             return "Other"
     
-    def calculate_prices(self, market: Dict[str, Any]) -> tuple[Decimal, Decimal]:
-        """Calculate Yes and No prices for the market."""
+    def _raw_yes_price(self, market: Dict[str, Any]) -> float:
+        """Look up the unclamped Yes price for the market."""
         try:
             # Try lastTradePrice first
             if market.get("lastTradePrice") is not None:
-                yes_price = float(market["lastTradePrice"])
-                no_price = 1.0 - yes_price
+                return float(market["lastTradePrice"])
             
             # Fall back to bid/ask midpoint
-            elif market.get("bestBid") is not None and market.get("bestAsk") is not None:
-                bid = float(market["bestBid"])
-                ask = float(market["bestAsk"])
-                yes_price = (bid + ask) / 2.0
-                no_price = 1.0 - yes_price
-            
-            else:
-                # Default to 50/50 if no pricing data
-                yes_price = 0.5
-                no_price = 0.5
-            
-            # Ensure prices are valid
-            yes_price = max(0.0, min(1.0, yes_price))
-            no_price = max(0.0, min(1.0, no_price))
-            
-            return Decimal(str(yes_price)), Decimal(str(no_price))
+            if market.get("bestBid") is not None and market.get("bestAsk") is not None:
+                return (float(market["bestBid"]) + float(market["bestAsk"])) / 2.0
             
         except (ValueError, TypeError):
-            # Default to 50/50 if calculation fails
-            return Decimal("0.5"), Decimal("0.5")
+            pass
+        
+        # Default to 50/50 if no usable pricing data
+        return 0.5
+    
+    def calculate_prices(self, market: Dict[str, Any]) -> tuple[Decimal, Decimal]:
+        """Calculate Yes and No prices for the market."""
+        yes_price = self._raw_yes_price(market)
+        return price_to_decimal(yes_price), price_to_decimal(1.0 - yes_price)
     
     def parse_outcomes(self, market: Dict[str, Any]) -> List[str]:
         """Parse and return outcome names."""
-        outcomes = market.get("outcomes", [])
-        
-        if isinstance(outcomes, str):
-            try:
-                outcomes = json.loads(outcomes)
-            except (json.JSONDecodeError, TypeError):
-                return ["Yes", "No"]  # Default binary outcomes
+        outcomes = self._load_outcomes(market)
         
-        if isinstance(outcomes, list) and len(outcomes) >= 2:
+        if isinstance(outcomes, (list, tuple)) and len(outcomes) >= 2:
             return [str(outcome) for outcome in outcomes[:2]]
         
         return ["Yes", "No"]  # Default binary outcomes
     
-    async def extract_market_details(self, market_id: str) -> Optional[Dict[str, Any]]:
-        """Extract detailed information for a specific market."""
+    async def extract_market_details(
+        self,
+        market_id: str,
+        *,
+        force: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Extract detailed information for a specific market.
+        
+        Recent lookups are served from a short-lived cache; pass ``force=True``
+        to always refetch.
+        """
+        if not force:
+            cached = self.get_cached_market_details(market_id)
+            if cached is not None:
+                return cached
+        
         try:
             response = await self.make_request("GET", f"markets/{market_id}")
-            return response
+            details = response
+            self.cache_market_details(market_id, details)
+            return details
         except Exception as e:
             self.logger.error(f"Failed to extract details for market {market_id}: {e}")
             return None
     
-    def transform_to_normalized_market(self, raw_market: RawMarketData) -> NormalizedMarket:
+    def transform_to_fast_market(
+        self,
+        raw_market: RawMarketData,
+        now: Optional[datetime] = None
+    ) -> FastNormalizedMarket:
         """Transform raw Polymarket data to normalized format."""
         market_data = raw_market.raw_data
+        now = now or datetime.utcnow()
         
         # Extract basic information
         external_id = raw_market.external_id
@@ -292,26 +341,26 @@ class PolymarketExtractor(BaseExtractor):
         # Parse outcomes or use defaults
         outcome_names = self.parse_outcomes(market_data)
         outcomes = [
-            MarketOutcome(name=outcome_names[0], price=yes_price),
-            MarketOutcome(name=outcome_names[1] if len(outcome_names) > 1 else "No", price=no_price)
+            FastMarketOutcome(name=outcome_names[0], price=yes_price),
+            FastMarketOutcome(name=outcome_names[1] if len(outcome_names) > 1 else "No", price=no_price)
         ]
         
         # Extract timing information
         end_date = None
         if market_data.get("endDate"):
             try:
-                end_date = datetime.fromisoformat(market_data["endDate"].replace("Z", "+00:00"))
+                end_date = parse_iso_timestamp(market_data["endDate"])
             except ValueError:
                 # If date parsing fails, set a default end date
-                end_date = datetime.utcnow().replace(year=datetime.utcnow().year + 1)
+                end_date = now + _DEFAULT_MARKET_LIFETIME
         else:
             # Default to 1 year from now if no end date
-            end_date = datetime.utcnow().replace(year=datetime.utcnow().year + 1)
+            end_date = now + _DEFAULT_MARKET_LIFETIME
         
         created_date = None
         if market_data.get("startDate"):
             try:
-                created_date = datetime.fromisoformat(market_data["startDate"].replace("Z", "+00:00"))
+                created_date = parse_iso_timestamp(market_data["startDate"])
             except ValueError:
                 pass
         
@@ -320,11 +369,15 @@ class PolymarketExtractor(BaseExtractor):
         liquidity = Decimal(str(market_data.get("liquidity", 0)))
         
         # Use tags from market data
-        tags = market_data.get("tags", [category.lower()])
-        if isinstance(tags, str):
-            tags = [tags]
+        tags = market_data.get("tags")
+        if tags is None:
+            tags = category_tags(category)
+        elif isinstance(tags, str):
+            tags = (tags,)
+        else:
+            tags = tuple(tags)
         
-        return NormalizedMarket(
+        return FastNormalizedMarket(
             platform=self.platform,
             external_id=external_id,
             title=question,
@@ -339,5 +392,5 @@ class PolymarketExtractor(BaseExtractor):
             liquidity=liquidity,
             status=MarketStatus.ACTIVE,
             is_active=True,
-            processed_at=datetime.utcnow()
+            processed_at=now
         )
\ No newline at end of file
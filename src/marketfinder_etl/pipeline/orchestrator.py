@@ -6,16 +6,23 @@ through arbitrage detection, managing the flow between engines and handling erro
 """
 
 import asyncio
+import heapq
+import operator
+import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from collections import deque
+from functools import cached_property
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, PrivateAttr, computed_field
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.core.config import settings
+from marketfinder_etl.core.serialization import dumps_json
 from marketfinder_etl.extractors import KalshiExtractor, PolymarketExtractor
 from marketfinder_etl.transformers import MarketNormalizer, DataEnricher
 from marketfinder_etl.engines import (
@@ -25,6 +32,11 @@ from marketfinder_etl.engines import (
     LLMEvaluationEngine,
     ArbitrageDetectionEngine
 )
+from marketfinder_etl.engines.filtering import (
+    FilterConfig,
+    FilterOrderStrategy,
+    validate_filter_order_strategy,
+)
 from marketfinder_etl.storage import DatabaseManager, CacheManager
 from marketfinder_etl.models.market import NormalizedMarket
 from marketfinder_etl.models.arbitrage import ArbitrageOpportunity
@@ -52,7 +64,7 @@ class PipelineStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
     """Configuration for pipeline execution."""
     # Data extraction limits
@@ -73,7 +85,9 @@ class PipelineConfig:
     
     # Pipeline behavior
     enable_caching: bool = True
+    bucket_assignment_cache_size: int = 10_000
     enable_parallel_processing: bool = True
+    filter_order_strategy: FilterOrderStrategy = "adaptive"
     fail_on_stage_error: bool = False
     max_retries: int = 3
     retry_delay_seconds: float = 5.0
@@ -81,6 +95,13 @@ class PipelineConfig:
     # Storage options
     store_intermediate_results: bool = True
     store_metrics: bool = True
+    
+    def __post_init__(self):
+        validate_filter_order_strategy(self.filter_order_strategy)
+
+
+# Error messages retained per execution record
+MAX_ERROR_MESSAGES = 1000
 
 
 class StageMetrics(BaseModel):
@@ -92,11 +113,14 @@ class StageMetrics(BaseModel):
     error_count: int
     processing_time_seconds: float
     memory_usage_mb: Optional[float] = None
-    throughput_per_second: float = 0.0
     
-    def __post_init__(self):
+    @computed_field
+    @cached_property
+    def throughput_per_second(self) -> float:
+        """Input items processed per second, computed once per record."""
         if self.processing_time_seconds > 0:
-            self.throughput_per_second = self.input_count / self.processing_time_seconds
+            return self.input_count / self.processing_time_seconds
+        return 0.0
 
 
 class PipelineExecution(BaseModel):
@@ -104,7 +128,7 @@ class PipelineExecution(BaseModel):
     execution_id: str
     status: PipelineStatus
     config: PipelineConfig
-    stage_metrics: List[StageMetrics] = []
+    stage_metrics: Dict[PipelineStage, StageMetrics] = {}  # In execution order
     
     # Timing
     started_at: datetime
@@ -114,11 +138,42 @@ class PipelineExecution(BaseModel):
     # Results
     total_opportunities_found: int = 0
     total_markets_processed: int = 0
-    error_messages: List[str] = []
+    total_errors: int = 0
     
     # Performance
     peak_memory_usage_mb: Optional[float] = None
     cache_hit_rate: Optional[float] = None
+    
+    # Monotonic start time for durations, immune to wall-clock adjustments
+    _started_monotonic_ns: int = PrivateAttr(default_factory=time.monotonic_ns)
+    
+    # Most recent error messages only, so error storms stay bounded in memory
+    _error_messages: deque = PrivateAttr(
+        default_factory=lambda: deque(maxlen=MAX_ERROR_MESSAGES)
+    )
+    
+    @computed_field
+    @property
+    def error_messages(self) -> List[str]:
+        """The most recent error messages, oldest first."""
+        return list(self._error_messages)
+    
+    def record_error(self, message: str) -> None:
+        """Record an error message, dropping the oldest beyond the limit."""
+        self._error_messages.append(message)
+        self.total_errors += 1
+    
+    def elapsed_seconds(self) -> float:
+        """Seconds elapsed since the execution record was created."""
+        return (time.monotonic_ns() - self._started_monotonic_ns) / 1e9
+    
+    def model_dump_json_fast(self) -> bytes:
+        """Serialize the execution record to JSON bytes with orjson."""
+        return dumps_json(
+            self.model_dump(),
+            # stage_metrics is keyed by PipelineStage, which orjson only accepts with NON_STR_KEYS
+            option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
 
 
 class PipelineOrchestrator(LoggerMixin):
@@ -134,14 +189,22 @@ class PipelineOrchestrator(LoggerMixin):
         self.execution_history: List[PipelineExecution] = []
         
         # Initialize components
+        # Extractors are kept for the orchestrator's lifetime so each reuses its
+        # HTTP connection pool (and warm keep-alive connections) across executions
+        self.kalshi_extractor = KalshiExtractor()
+        self.polymarket_extractor = PolymarketExtractor()
         self.database_manager = DatabaseManager()
         self.cache_manager = CacheManager()
         self.market_normalizer = MarketNormalizer()
         self.data_enricher = DataEnricher()
         
         # Initialize engines
-        self.bucketing_engine = SemanticBucketingEngine()
-        self.filtering_engine = HierarchicalFilteringEngine()
+        self.bucketing_engine = SemanticBucketingEngine(
+            assignment_cache_size=self.config.bucket_assignment_cache_size if self.config.enable_caching else 0
+        )
+        self.filtering_engine = HierarchicalFilteringEngine(
+            FilterConfig(filter_order_strategy=self.config.filter_order_strategy)
+        )
         self.ml_scoring_engine = MLScoringEngine()
         self.llm_evaluation_engine = LLMEvaluationEngine()
         self.arbitrage_detection_engine = ArbitrageDetectionEngine()
@@ -183,14 +246,12 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 1: Data Extraction
             raw_markets = await self._execute_stage_with_metrics(
                 PipelineStage.EXTRACTION,
-                self._extract_market_data,
                 execution
             )
             
             # Stage 2: Data Normalization
             normalized_markets = await self._execute_stage_with_metrics(
                 PipelineStage.NORMALIZATION,
-                self._normalize_market_data,
                 execution,
                 raw_markets
             )
@@ -198,7 +259,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 3: Data Enrichment
             enriched_markets = await self._execute_stage_with_metrics(
                 PipelineStage.ENRICHMENT,
-                self._enrich_market_data,
                 execution,
                 normalized_markets
             )
@@ -206,7 +266,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 4: Semantic Bucketing
             bucket_pairs = await self._execute_stage_with_metrics(
                 PipelineStage.BUCKETING,
-                self._execute_bucketing,
                 execution,
                 [em.market for em in enriched_markets]
             )
@@ -214,7 +273,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 5: Hierarchical Filtering
             filtered_pairs = await self._execute_stage_with_metrics(
                 PipelineStage.FILTERING,
-                self._execute_filtering,
                 execution,
                 bucket_pairs
             )
@@ -222,7 +280,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 6: ML Scoring
             ml_scored_pairs = await self._execute_stage_with_metrics(
                 PipelineStage.ML_SCORING,
-                self._execute_ml_scoring,
                 execution,
                 filtered_pairs
             )
@@ -230,7 +287,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 7: LLM Evaluation
             llm_evaluated_pairs = await self._execute_stage_with_metrics(
                 PipelineStage.LLM_EVALUATION,
-                self._execute_llm_evaluation,
                 execution,
                 ml_scored_pairs
             )
@@ -238,7 +294,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 8: Arbitrage Detection
             arbitrage_opportunities = await self._execute_stage_with_metrics(
                 PipelineStage.ARBITRAGE_DETECTION,
-                self._execute_arbitrage_detection,
                 execution,
                 llm_evaluated_pairs
             )
@@ -246,7 +301,6 @@ class PipelineOrchestrator(LoggerMixin):
             # Stage 9: Storage
             await self._execute_stage_with_metrics(
                 PipelineStage.STORAGE,
-                self._store_results,
                 execution,
                 {
                     'normalized_markets': normalized_markets,
@@ -258,9 +312,7 @@ class PipelineOrchestrator(LoggerMixin):
             # Complete execution
             execution.status = PipelineStatus.COMPLETED
             execution.completed_at = datetime.utcnow()
-            execution.total_duration_seconds = (
-                execution.completed_at - execution.started_at
-            ).total_seconds()
+            execution.total_duration_seconds = execution.elapsed_seconds()
             execution.total_opportunities_found = len(arbitrage_opportunities)
             execution.total_markets_processed = len(normalized_markets)
             
@@ -281,7 +333,7 @@ class PipelineOrchestrator(LoggerMixin):
         except Exception as e:
             execution.status = PipelineStatus.FAILED
             execution.completed_at = datetime.utcnow()
-            execution.error_messages.append(str(e))
+            execution.record_error(str(e))
             
             self.logger.error(f"Pipeline execution failed: {e}", execution_id=execution_id)
             
@@ -294,27 +346,28 @@ class PipelineOrchestrator(LoggerMixin):
             self.is_running = False
             self.execution_history.append(execution)
             self.current_execution = None
+            
+            if execution.config.store_metrics:
+                await self._store_execution(execution)
     
     async def _execute_stage_with_metrics(
         self,
         stage: PipelineStage,
-        stage_func,
         execution: PipelineExecution,
         *args
     ) -> Any:
-        """Execute a pipeline stage with metrics collection."""
+        """Execute a pipeline stage's handler with metrics collection."""
         
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         input_count = len(args[0]) if args and hasattr(args[0], '__len__') else 0
         
         self.logger.info(f"Starting stage: {stage.value}", input_count=input_count)
         
         try:
-            result = await stage_func(*args)
+            result = await _STAGE_HANDLERS[stage](self, *args)
             
             # Calculate metrics
-            end_time = datetime.utcnow()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
             output_count = len(result) if hasattr(result, '__len__') else 0
             
             metrics = StageMetrics(
@@ -326,7 +379,7 @@ class PipelineOrchestrator(LoggerMixin):
                 processing_time_seconds=processing_time
             )
             
-            execution.stage_metrics.append(metrics)
+            execution.stage_metrics[stage] = metrics
             
             self.logger.info(
                 f"Stage completed: {stage.value}",
@@ -339,8 +392,7 @@ class PipelineOrchestrator(LoggerMixin):
             
         except Exception as e:
             # Record failed stage metrics
-            end_time = datetime.utcnow()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
             
             metrics = StageMetrics(
                 stage=stage,
@@ -351,8 +403,8 @@ class PipelineOrchestrator(LoggerMixin):
                 processing_time_seconds=processing_time
             )
             
-            execution.stage_metrics.append(metrics)
-            execution.error_messages.append(f"{stage.value}: {str(e)}")
+            execution.stage_metrics[stage] = metrics
+            execution.record_error(f"{stage.value}: {str(e)}")
             
             self.logger.error(f"Stage failed: {stage.value}", error=str(e))
             
@@ -369,14 +421,14 @@ class PipelineOrchestrator(LoggerMixin):
         # Initialize extractors
         if not self.config.max_kalshi_markets or self.config.max_kalshi_markets > 0:
             extractors.append(
-                KalshiExtractor().extract_markets(
+                self.kalshi_extractor.extract_markets(
                     max_markets=self.config.max_kalshi_markets
                 )
             )
         
         if not self.config.max_polymarket_markets or self.config.max_polymarket_markets > 0:
             extractors.append(
-                PolymarketExtractor().extract_markets(
+                self.polymarket_extractor.extract_markets(
                     max_markets=self.config.max_polymarket_markets
                 )
             )
@@ -456,17 +508,12 @@ class PipelineOrchestrator(LoggerMixin):
     
     async def _execute_ml_scoring(self, filtered_pairs: List) -> List:
         """Execute ML scoring."""
-        ml_predictions = []
-        
-        for pair in filtered_pairs:
-            try:
-                prediction = await self.ml_scoring_engine.score_market_pair(pair)
-                if prediction.llm_worthiness_score >= self.config.min_ml_score:
-                    ml_predictions.append((pair, prediction))
-            except Exception as e:
-                self.logger.warning(f"ML scoring failed for pair: {e}")
+        scored_pairs = await self.ml_scoring_engine.score_market_pairs(filtered_pairs)
         
-        return ml_predictions
+        return [
+            (pair, prediction) for pair, prediction in scored_pairs
+            if prediction.llm_worthiness_score >= self.config.min_ml_score
+        ]
     
     async def _execute_llm_evaluation(self, ml_scored_pairs: List) -> List:
         """Execute LLM evaluation."""
@@ -495,6 +542,27 @@ class PipelineOrchestrator(LoggerMixin):
                 results['opportunities']
             )
     
+    async def _store_execution(self, execution: PipelineExecution) -> None:
+        """Persist an execution record; failures are logged, not raised."""
+        
+        try:
+            await self.database_manager.store_pipeline_execution(
+                execution_id=execution.execution_id,
+                status=execution.status.value,
+                stage_rows=[
+                    metrics.model_dump(mode="json")
+                    for metrics in execution.stage_metrics.values()
+                ],
+                execution_record=execution.model_dump_json_fast(),
+                started_at=execution.started_at,
+                completed_at=execution.completed_at
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to store pipeline execution: {e}",
+                execution_id=execution.execution_id
+            )
+    
     def get_execution_status(self) -> Optional[Dict[str, Any]]:
         """Get current execution status."""
         if not self.current_execution:
@@ -505,7 +573,7 @@ class PipelineOrchestrator(LoggerMixin):
             "status": self.current_execution.status.value,
             "started_at": self.current_execution.started_at.isoformat(),
             "current_stage": (
-                self.current_execution.stage_metrics[-1].stage.value
+                next(reversed(self.current_execution.stage_metrics)).value
                 if self.current_execution.stage_metrics else "starting"
             ),
             "stages_completed": len(self.current_execution.stage_metrics),
@@ -516,11 +584,10 @@ class PipelineOrchestrator(LoggerMixin):
     def get_execution_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent execution history."""
         
-        recent_executions = sorted(
-            self.execution_history,
-            key=lambda x: x.started_at,
-            reverse=True
-        )[:limit]
+        # O(N log limit) selection instead of sorting the whole history
+        recent_executions = heapq.nlargest(
+            limit, self.execution_history, key=operator.attrgetter("started_at")
+        )
         
         return [
             {
@@ -531,7 +598,7 @@ class PipelineOrchestrator(LoggerMixin):
                 "duration_seconds": exec.total_duration_seconds,
                 "opportunities_found": exec.total_opportunities_found,
                 "markets_processed": exec.total_markets_processed,
-                "error_count": len(exec.error_messages)
+                "error_count": exec.total_errors
             }
             for exec in recent_executions
         ]
@@ -550,7 +617,26 @@ class PipelineOrchestrator(LoggerMixin):
     
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        await asyncio.gather(self.kalshi_extractor.close(), self.polymarket_extractor.close())
         await self.database_manager.close()
         await self.cache_manager.clear()
         
-        self.logger.info("Pipeline orchestrator cleanup completed")
\ No newline at end of file
+        self.logger.info("Pipeline orchestrator cleanup completed")
+
+
+# Stage dispatch table, checked for exhaustiveness at import time
+_STAGE_HANDLERS: Dict[PipelineStage, Callable[..., Awaitable[Any]]] = {
+    PipelineStage.EXTRACTION: PipelineOrchestrator._extract_market_data,
+    PipelineStage.NORMALIZATION: PipelineOrchestrator._normalize_market_data,
+    PipelineStage.ENRICHMENT: PipelineOrchestrator._enrich_market_data,
+    PipelineStage.BUCKETING: PipelineOrchestrator._execute_bucketing,
+    PipelineStage.FILTERING: PipelineOrchestrator._execute_filtering,
+    PipelineStage.ML_SCORING: PipelineOrchestrator._execute_ml_scoring,
+    PipelineStage.LLM_EVALUATION: PipelineOrchestrator._execute_llm_evaluation,
+    PipelineStage.ARBITRAGE_DETECTION: PipelineOrchestrator._execute_arbitrage_detection,
+    PipelineStage.STORAGE: PipelineOrchestrator._store_results,
+}
+
+_missing_stage_handlers = set(PipelineStage) - set(_STAGE_HANDLERS)
+if _missing_stage_handlers:
+    raise RuntimeError(f"Pipeline stages without handlers: {sorted(_missing_stage_handlers)}")
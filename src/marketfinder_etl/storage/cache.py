@@ -7,14 +7,17 @@ and computed results with TTL-based expiration and memory management.
 
 import asyncio
 import hashlib
-import json
+import heapq
 import pickle
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 import weakref
 
+import orjson
 from pydantic import BaseModel
 
 from marketfinder_etl.core.logging import LoggerMixin
@@ -50,20 +53,38 @@ class CacheMetrics(BaseModel):
         return 1.0 - self.hit_rate
 
 
-@dataclass
+@dataclass(slots=True)
+class _LookupCounters:
+    """Lookup counters accumulated per get() and flushed into CacheMetrics.
+    
+    Plain slot increments keep pydantic attribute writes off the lookup path.
+    """
+    total_requests: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    lookup_time_ns: int = 0
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """Individual cache entry with metadata."""
+    """Individual cache entry with metadata.
+    
+    Creation and access times are kept as epoch nanoseconds so that
+    ``touch`` on every cache hit avoids building a datetime.
+    """
     key: str
     value: Any
-    created_at: datetime
     expires_at: Optional[datetime]
+    created_at_ns: int = 0
     access_count: int = 0
-    last_accessed: datetime = None
+    last_accessed_ns: int = 0
     size_bytes: int = 0
     
     def __post_init__(self):
-        if self.last_accessed is None:
-            self.last_accessed = self.created_at
+        if self.created_at_ns == 0:
+            self.created_at_ns = time.time_ns()
+        if self.last_accessed_ns == 0:
+            self.last_accessed_ns = self.created_at_ns
         
         # Estimate size if not provided
         if self.size_bytes == 0:
@@ -78,7 +99,7 @@ class CacheEntry:
             if isinstance(self.value, str):
                 return len(self.value.encode('utf-8'))
             elif isinstance(self.value, (list, dict)):
-                return len(json.dumps(self.value, default=str).encode('utf-8'))
+                return len(orjson.dumps(self.value, default=str, option=orjson.OPT_NON_STR_KEYS))
             else:
                 return 1024  # Default estimate
     
@@ -89,15 +110,25 @@ class CacheEntry:
             return False
         return datetime.utcnow() > self.expires_at
     
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a UTC datetime."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
+    
+    @property
+    def last_accessed(self) -> datetime:
+        """Last access time as a UTC datetime."""
+        return datetime.fromtimestamp(self.last_accessed_ns / 1e9, tz=timezone.utc)
+    
     @property
     def age_seconds(self) -> float:
         """Get age of entry in seconds."""
-        return (datetime.utcnow() - self.created_at).total_seconds()
+        return (time.time_ns() - self.created_at_ns) / 1e9
     
     def touch(self) -> None:
         """Update access metadata."""
         self.access_count += 1
-        self.last_accessed = datetime.utcnow()
+        self.last_accessed_ns = time.time_ns()
 
 
 class CacheConfig(BaseModel):
@@ -137,9 +168,15 @@ class CacheManager(LoggerMixin):
         self.config = config or CacheConfig()
         self.cache: Dict[str, CacheEntry] = {}
         self.metrics = CacheMetrics()
+        self._lookup_counters = _LookupCounters()
         self._lock = asyncio.Lock()
         self._cleanup_task: Optional[asyncio.Task] = None
         
+        # Min-heap of (expires_at, key) so cleanup only visits due entries;
+        # entries made stale by overwrites or deletes are skipped when popped
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._expiry_rescheduled = asyncio.Event()
+        
         # Start background cleanup if enabled
         if self.config.auto_cleanup:
             self._start_cleanup_task()
@@ -153,7 +190,20 @@ class CacheManager(LoggerMixin):
         """Background task for periodic cache cleanup."""
         while True:
             try:
-                await asyncio.sleep(self.config.cleanup_interval_seconds)
+                # Sleep until the next entry is due, or an earlier one is scheduled;
+                # the cleanup interval still bounds the memory pressure checks
+                delay = self.config.cleanup_interval_seconds
+                if self._expiry_heap:
+                    until_next_expiry = (self._expiry_heap[0][0] - datetime.utcnow()).total_seconds()
+                    delay = min(delay, max(0.0, until_next_expiry))
+                
+                self._expiry_rescheduled.clear()
+                try:
+                    await asyncio.wait_for(self._expiry_rescheduled.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+                
                 await self.cleanup_expired()
                 await self._check_memory_pressure()
             except asyncio.CancelledError:
@@ -163,29 +213,30 @@ class CacheManager(LoggerMixin):
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
+        counters = self._lookup_counters
         
         async with self._lock:
-            self.metrics.total_requests += 1
+            counters.total_requests += 1
             
             if key not in self.cache:
-                self.metrics.cache_misses += 1
-                self._update_lookup_time(start_time)
+                counters.cache_misses += 1
+                counters.lookup_time_ns += time.monotonic_ns() - start_ns
                 return None
             
             entry = self.cache[key]
             
             # Check if expired
             if entry.is_expired:
-                del self.cache[key]
-                self.metrics.cache_misses += 1
-                self._update_lookup_time(start_time)
+                self._remove_entry(key)
+                counters.cache_misses += 1
+                counters.lookup_time_ns += time.monotonic_ns() - start_ns
                 return None
             
             # Update access metadata
             entry.touch()
-            self.metrics.cache_hits += 1
-            self._update_lookup_time(start_time)
+            counters.cache_hits += 1
+            counters.lookup_time_ns += time.monotonic_ns() - start_ns
             
             return entry.value
     
@@ -212,7 +263,6 @@ class CacheManager(LoggerMixin):
             entry = CacheEntry(
                 key=key,
                 value=value,
-                created_at=datetime.utcnow(),
                 expires_at=expires_at
             )
             
@@ -220,9 +270,15 @@ class CacheManager(LoggerMixin):
             if await self._would_exceed_limits(entry):
                 await self._evict_entries()
             
-            # Add to cache
+            # Add to cache; re-inserting keeps the dict in creation order for FIFO eviction
+            self._remove_entry(key)
             self.cache[key] = entry
-            self._update_memory_usage()
+            self.metrics.memory_usage_bytes += entry.size_bytes
+            
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+                if self._expiry_heap[0][1] == key:
+                    self._expiry_rescheduled.set()
             
             self.logger.debug(f"Cached value for key: {key[:50]}...")
             return True
@@ -231,8 +287,7 @@ class CacheManager(LoggerMixin):
         """Delete value from cache."""
         async with self._lock:
             if key in self.cache:
-                del self.cache[key]
-                self._update_memory_usage()
+                self._remove_entry(key)
                 return True
             return False
     
@@ -240,25 +295,36 @@ class CacheManager(LoggerMixin):
         """Clear all cache entries."""
         async with self._lock:
             self.cache.clear()
+            self._expiry_heap.clear()
             self.metrics.memory_usage_bytes = 0
             self.logger.info("Cache cleared")
     
     async def cleanup_expired(self) -> int:
         """Remove expired entries from cache."""
         async with self._lock:
-            expired_keys = [
-                key for key, entry in self.cache.items()
-                if entry.is_expired
-            ]
+            now = datetime.utcnow()
+            removed = 0
             
-            for key in expired_keys:
-                del self.cache[key]
+            # Pop only the entries that are due instead of scanning the whole cache
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                entry = self.cache.get(key)
+                if entry is not None and entry.expires_at == expires_at:
+                    self._remove_entry(key)
+                    removed += 1
             
-            if expired_keys:
-                self._update_memory_usage()
-                self.logger.debug(f"Removed {len(expired_keys)} expired cache entries")
+            # Drop stale heap entries once they outnumber the live ones
+            if len(self._expiry_heap) > 2 * len(self.cache) + self.config.eviction_batch_size:
+                self._expiry_heap = [
+                    (entry.expires_at, key) for key, entry in self.cache.items()
+                    if entry.expires_at is not None
+                ]
+                heapq.heapify(self._expiry_heap)
             
-            return len(expired_keys)
+            if removed:
+                self.logger.debug(f"Removed {removed} expired cache entries")
+            
+            return removed
     
     async def _would_exceed_limits(self, new_entry: CacheEntry) -> bool:
         """Check if adding entry would exceed cache limits."""
@@ -293,23 +359,22 @@ class CacheManager(LoggerMixin):
         )
         
         # Get entries to evict based on strategy
-        if self.config.eviction_strategy == CacheStrategy.LRU:
+        strategy = self.config.eviction_strategy
+        if strategy is CacheStrategy.LRU:
             entries_to_remove = sorted(
                 self.cache.items(),
-                key=lambda x: x[1].last_accessed
+                key=lambda x: x[1].last_accessed_ns
             )[:entries_to_evict]
         
-        elif self.config.eviction_strategy == CacheStrategy.LFU:
+        elif strategy is CacheStrategy.LFU:
             entries_to_remove = sorted(
                 self.cache.items(),
                 key=lambda x: x[1].access_count
             )[:entries_to_evict]
         
-        elif self.config.eviction_strategy == CacheStrategy.FIFO:
-            entries_to_remove = sorted(
-                self.cache.items(),
-                key=lambda x: x[1].created_at
-            )[:entries_to_evict]
+        elif strategy is CacheStrategy.FIFO:
+            # The dict is kept in creation order, so the oldest entries come first
+            entries_to_remove = list(islice(self.cache.items(), entries_to_evict))
         
         else:  # TTL strategy - remove entries closest to expiration
             entries_to_remove = sorted(
@@ -319,30 +384,42 @@ class CacheManager(LoggerMixin):
         
         # Remove selected entries
         for key, _ in entries_to_remove:
-            del self.cache[key]
+            self._remove_entry(key)
         
         self.metrics.evictions += len(entries_to_remove)
-        self._update_memory_usage()
         
         self.logger.debug(f"Evicted {len(entries_to_remove)} cache entries using {self.config.eviction_strategy} strategy")
         return len(entries_to_remove)
     
+    def _remove_entry(self, key: str) -> None:
+        """Remove an entry if present, keeping the memory usage total in step."""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.metrics.memory_usage_bytes -= entry.size_bytes
+    
     def _update_memory_usage(self) -> None:
         """Update memory usage metrics."""
         total_size = sum(entry.size_bytes for entry in self.cache.values())
         self.metrics.memory_usage_bytes = total_size
     
-    def _update_lookup_time(self, start_time: datetime) -> None:
-        """Update average lookup time."""
-        lookup_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+    def _flush_lookup_counters(self) -> None:
+        """Fold the lookups counted since the last flush into the metrics."""
+        counters = self._lookup_counters
+        if counters.total_requests == 0:
+            return
         
-        # Update running average
-        total_requests = self.metrics.total_requests
-        current_avg = self.metrics.avg_lookup_time_ms
+        previous_requests = self.metrics.total_requests
+        total_requests = previous_requests + counters.total_requests
         
+        # Update running average
         self.metrics.avg_lookup_time_ms = (
-            (current_avg * (total_requests - 1) + lookup_time_ms) / total_requests
-        )
+            self.metrics.avg_lookup_time_ms * previous_requests + counters.lookup_time_ns / 1e6
+        ) / total_requests
+        self.metrics.total_requests = total_requests
+        self.metrics.cache_hits += counters.cache_hits
+        self.metrics.cache_misses += counters.cache_misses
+        
+        self._lookup_counters = _LookupCounters()
     
     # Bulk operations
     
@@ -391,8 +468,10 @@ class CacheManager(LoggerMixin):
             'kwargs': sorted(kwargs.items())
         }
         
-        key_string = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_bytes = orjson.dumps(
+            key_data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.md5(key_bytes).hexdigest()
     
     def generate_prefix_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate cache key with prefix."""
@@ -403,11 +482,13 @@ class CacheManager(LoggerMixin):
     
     def get_metrics(self) -> CacheMetrics:
         """Get current cache metrics."""
+        self._flush_lookup_counters()
         self._update_memory_usage()
         return self.metrics
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get detailed cache information."""
+        self._flush_lookup_counters()
         self._update_memory_usage()
         
         # Calculate additional statistics
@@ -415,7 +496,8 @@ class CacheManager(LoggerMixin):
         expired_entries = sum(1 for entry in self.cache.values() if entry.is_expired)
         
         if total_entries > 0:
-            avg_age = sum(entry.age_seconds for entry in self.cache.values()) / total_entries
+            avg_created_ns = sum(entry.created_at_ns for entry in self.cache.values()) / total_entries
+            avg_age = (time.time_ns() - avg_created_ns) / 1e9
             avg_access_count = sum(entry.access_count for entry in self.cache.values()) / total_entries
         else:
             avg_age = 0
@@ -439,6 +521,8 @@ class CacheManager(LoggerMixin):
     def reset_metrics(self) -> None:
         """Reset cache metrics."""
         self.metrics = CacheMetrics()
+        self._lookup_counters = _LookupCounters()
+        self._update_memory_usage()
         self.logger.info("Cache metrics reset")
     
     # Context manager support
@@ -6,7 +6,6 @@ and PostgreSQL for transactional data with automatic schema management.
 """
 
 import asyncio
-import json
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -20,11 +19,17 @@ from pydantic import BaseModel
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.core.config import settings
+from marketfinder_etl.core.serialization import dumps_json
 from marketfinder_etl.models.market import NormalizedMarket, MarketPlatform
 from marketfinder_etl.models.arbitrage import ArbitrageOpportunity, LLMEvaluation
 from marketfinder_etl.transformers.data_enricher import EnrichedMarket
 
 
+def _dumps_json(obj: Any) -> str:
+    """Encode a value for a JSON column using orjson."""
+    return dumps_json(obj).decode()
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration."""
     # DuckDB settings (for analytics)
@@ -364,7 +369,7 @@ class DatabaseManager(LoggerMixin):
                     str(uuid.uuid4()),  # id
                     data.get("platform", ""),
                     data.get("external_id", ""),
-                    json.dumps(data.get("raw_data", {})),
+                    _dumps_json(data.get("raw_data", {})),
                     data.get("fetched_at", datetime.utcnow()),
                     "pending"
                 )
@@ -414,8 +419,8 @@ class DatabaseManager(LoggerMixin):
                     market.created_date,
                     market.end_date,
                     market.normalized_at,
-                    json.dumps([outcome.dict() for outcome in market.outcomes]),
-                    json.dumps(market.dict(exclude={"outcomes"}))
+                    _dumps_json([outcome.dict() for outcome in market.outcomes]),
+                    _dumps_json(market.dict(exclude={"outcomes"}))
                 )
                 records.append(record)
             
@@ -455,7 +460,7 @@ class DatabaseManager(LoggerMixin):
                     opp.market1_id,
                     opp.market2_id,
                     opp.arbitrage_type,
-                    json.dumps(opp.strategy.dict()),
+                    _dumps_json(opp.strategy.dict()),
                     float(opp.position_size),
                     float(opp.metrics.expected_profit_usd),
                     opp.metrics.expected_profit_percentage,
@@ -468,9 +473,9 @@ class DatabaseManager(LoggerMixin):
                     opp.detected_at,
                     opp.expires_at,
                     None,  # executed_at
-                    json.dumps(opp.metrics.dict()),
-                    json.dumps(opp.transaction_costs.dict()),
-                    json.dumps(opp.risk_assessment.dict())
+                    _dumps_json(opp.metrics.dict()),
+                    _dumps_json(opp.transaction_costs.dict()),
+                    _dumps_json(opp.risk_assessment.dict())
                 )
                 records.append(record)
             
@@ -495,6 +500,72 @@ class DatabaseManager(LoggerMixin):
             self.logger.error(f"Failed to store arbitrage opportunities: {e}")
             raise
     
+    async def store_pipeline_execution(
+        self,
+        execution_id: str,
+        status: str,
+        stage_rows: List[Dict[str, Any]],
+        execution_record: bytes,
+        started_at: datetime,
+        completed_at: Optional[datetime] = None
+    ) -> int:
+        """Store per-stage metrics and the full record of a pipeline execution.
+        
+        Each stage gets its own row; a final ``pipeline`` row carries the
+        already-serialized execution record in its metrics column.
+        """
+        
+        start_time = datetime.utcnow()
+        
+        try:
+            records = [
+                (
+                    str(uuid.uuid4()),  # id
+                    execution_id,
+                    row["stage"],
+                    status,
+                    row["input_count"],
+                    row["output_count"],
+                    int(row["processing_time_seconds"] * 1000),
+                    None,  # error_message
+                    _dumps_json(row),
+                    started_at,
+                    completed_at
+                )
+                for row in stage_rows
+            ]
+            records.append((
+                str(uuid.uuid4()),
+                execution_id,
+                "pipeline",
+                status,
+                None,
+                None,
+                None,
+                None,
+                execution_record.decode(),
+                started_at,
+                completed_at
+            ))
+            
+            self.duckdb_conn.executemany(
+                """INSERT INTO pipeline_executions 
+                   (id, execution_id, stage, status, input_count, output_count,
+                    processing_time_ms, error_message, metrics, started_at, completed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                records
+            )
+            
+            processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            self._update_insert_stats(len(records), processing_time)
+            
+            self.logger.info(f"Stored pipeline execution {execution_id}")
+            return len(records)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to store pipeline execution: {e}")
+            raise
+    
     # Data retrieval methods
     
     async def get_markets_by_platform(
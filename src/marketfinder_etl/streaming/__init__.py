@@ -1,8 +1,19 @@
-"""Real-time streaming modules for MarketFinder ETL."""
+"""Real-time streaming modules for MarketFinder ETL.
 
-from marketfinder_etl.streaming.kafka_producer import KafkaProducer, KafkaConfig
-from marketfinder_etl.streaming.kafka_consumer import KafkaConsumer, ConsumerConfig
-from marketfinder_etl.streaming.stream_manager import StreamManager
+Streaming classes are imported lazily on first attribute access, so the
+Kafka client is only loaded when streaming is actually used.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    "KafkaProducer": "marketfinder_etl.streaming.kafka_producer",
+    "KafkaConfig": "marketfinder_etl.streaming.kafka_producer",
+    "KafkaConsumer": "marketfinder_etl.streaming.kafka_consumer",
+    "ConsumerConfig": "marketfinder_etl.streaming.kafka_consumer",
+    "StreamManager": "marketfinder_etl.streaming.stream_manager",
+}
 
 __all__ = [
     "KafkaProducer",
@@ -10,4 +21,17 @@ __all__ = [
     "KafkaConsumer",
     "ConsumerConfig",
     "StreamManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import streaming classes on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,16 @@ and arbitrage opportunities from Kafka streams for real-time analysis.
 """
 
 import asyncio
-import json
-from typing import Any, Callable, Dict, List, Optional, Set
-from datetime import datetime
-import uuid
+import heapq
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from collections import deque
+from itertools import islice
 
+import numpy as np
+import msgspec
+import orjson
 from aiokafka import AIOKafkaConsumer
 from pydantic import BaseModel
 
@@ -21,6 +26,15 @@ from marketfinder_etl.streaming.kafka_producer import (
 )
 
 
+# Opportunity actions that end an opportunity's lifetime
+_CLOSING_ACTIONS = frozenset({"expired", "executed"})
+
+# Log labels for the alert severities the producer emits
+_SEVERITY_LABELS = {
+    severity: severity.upper() for severity in ("low", "medium", "high", "critical")
+}
+
+
 class ConsumerConfig(BaseModel):
     """Kafka consumer configuration."""
     bootstrap_servers: str = "localhost:9092"
@@ -46,6 +60,9 @@ class ConsumerConfig(BaseModel):
     sasl_mechanism: Optional[str] = None
     sasl_username: Optional[str] = None
     sasl_password: Optional[str] = None
+    
+    # Serialization settings, matching the producer's message_format
+    message_format: str = "json"  # "json" or "msgpack"
 
 
 class MessageHandler:
@@ -75,6 +92,8 @@ class RealTimeArbitrageHandler(MessageHandler):
         self.active_opportunities: Dict[str, ArbitrageOpportunityMessage] = {}
         self.high_profit_threshold = 0.1  # 10%
         self.notification_callbacks: List[Callable] = []
+        # Min-heap of (expires_at, opportunity_id); entries are dropped lazily once stale
+        self._expiry_heap: List[Tuple[datetime, str]] = []
     
     async def handle_arbitrage_opportunity(self, message: ArbitrageOpportunityMessage) -> None:
         """Process arbitrage opportunities in real-time."""
@@ -84,6 +103,7 @@ class RealTimeArbitrageHandler(MessageHandler):
         if message.action == "detected":
             # New opportunity detected
             self.active_opportunities[opportunity_id] = message
+            self._schedule_expiry(message)
             
             # Check for high-profit opportunities
             if message.expected_profit_percentage >= self.high_profit_threshold:
@@ -93,11 +113,40 @@ class RealTimeArbitrageHandler(MessageHandler):
             # Update existing opportunity
             if opportunity_id in self.active_opportunities:
                 self.active_opportunities[opportunity_id] = message
+                self._schedule_expiry(message)
         
-        elif message.action in ["expired", "executed"]:
+        elif message.action in _CLOSING_ACTIONS:
             # Remove expired/executed opportunities
             self.active_opportunities.pop(opportunity_id, None)
     
+    def _schedule_expiry(self, message: ArbitrageOpportunityMessage) -> None:
+        """Push an opportunity's expiry time onto the expiry heap."""
+        if message.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (message.expires_at, message.opportunity_id))
+    
+    def next_expiry(self) -> Optional[datetime]:
+        """Get the earliest scheduled expiry time, if any."""
+        return self._expiry_heap[0][0] if self._expiry_heap else None
+    
+    def expire_due_opportunities(self, now: Optional[datetime] = None) -> int:
+        """Remove opportunities whose expiry time has passed.
+        
+        Returns the number of opportunities removed.
+        """
+        now = now or datetime.utcnow()
+        heap = self._expiry_heap
+        expired = 0
+        
+        while heap and heap[0][0] <= now:
+            expires_at, opportunity_id = heapq.heappop(heap)
+            message = self.active_opportunities.get(opportunity_id)
+            # Skip entries superseded by an update or an explicit close
+            if message is not None and message.expires_at == expires_at:
+                del self.active_opportunities[opportunity_id]
+                expired += 1
+        
+        return expired
+    
     async def _notify_high_profit_opportunity(self, message: ArbitrageOpportunityMessage) -> None:
         """Notify about high-profit opportunities."""
         
@@ -113,12 +162,14 @@ class RealTimeArbitrageHandler(MessageHandler):
             "expires_at": message.expires_at
         }
         
-        # Send notifications to registered callbacks
-        for callback in self.notification_callbacks:
-            try:
-                await callback(notification)
-            except Exception as e:
-                print(f"Notification callback failed: {e}")
+        # Send notifications to registered callbacks concurrently
+        results = await asyncio.gather(
+            *(callback(notification) for callback in self.notification_callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Notification callback failed: {result}")
     
     def add_notification_callback(self, callback: Callable) -> None:
         """Add callback for opportunity notifications."""
@@ -148,16 +199,26 @@ class MarketDataAggregator(MessageHandler):
         self.market_data: Dict[str, Dict] = {}
         self.update_counts: Dict[str, int] = {}
         self.last_update_times: Dict[str, datetime] = {}
+        
+        # Maintained on each update so the summary does not rescan every market
+        self.total_updates = 0
+        self.platforms: Set[str] = set()
+        # Epoch seconds of each market's last update, converted once on receipt
+        self._last_update_epochs: Dict[str, float] = {}
     
     async def handle_market_update(self, message: MarketUpdateMessage) -> None:
         """Aggregate market data updates."""
         
-        market_key = f"{message.platform}:{message.external_id}"
+        platform = f"{message.platform}"
+        market_key = f"{platform}:{message.external_id}"
         
         # Update market data
         self.market_data[market_key] = message.current_market
         self.update_counts[market_key] = self.update_counts.get(market_key, 0) + 1
+        self.total_updates += 1
+        self.platforms.add(platform)
         self.last_update_times[market_key] = message.timestamp
+        self._last_update_epochs[market_key] = message.timestamp.timestamp()
         
         # Log significant price changes
         if message.update_type == "price_change" and message.old_values:
@@ -173,14 +234,14 @@ class MarketDataAggregator(MessageHandler):
         """Get market data summary."""
         
         total_markets = len(self.market_data)
-        total_updates = sum(self.update_counts.values())
+        total_updates = self.total_updates
         avg_updates_per_market = total_updates / max(1, total_markets)
         
         # Recent activity (last hour)
         recent_cutoff = datetime.utcnow().timestamp() - 3600
         recent_updates = sum(
-            1 for timestamp in self.last_update_times.values()
-            if timestamp.timestamp() > recent_cutoff
+            1 for epoch in self._last_update_epochs.values()
+            if epoch > recent_cutoff
         )
         
         return {
@@ -188,19 +249,63 @@ class MarketDataAggregator(MessageHandler):
             "total_updates": total_updates,
             "avg_updates_per_market": avg_updates_per_market,
             "recent_updates_last_hour": recent_updates,
-            "platforms": list(set(
-                market_key.split(":")[0] 
-                for market_key in self.market_data.keys()
-            ))
+            "platforms": list(self.platforms)
         }
 
 
+class StagePerformanceSeries:
+    """Per-stage performance samples, the most recent kept in numpy ring buffers."""
+    
+    def __init__(self, capacity: int = 1000):
+        self.processing_times = np.empty(capacity, dtype=np.float64)
+        self.success_rates = np.empty(capacity, dtype=np.float64)
+        self.size = 0  # Samples recorded in total, including overwritten ones
+        self._next = 0
+        
+        # Running totals so all-sample means are O(1) for frequent polling
+        self._total_processing_time = 0.0
+        self._total_success_rate = 0.0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, processing_time_seconds: float, success_rate: float) -> None:
+        """Record one sample, overwriting the oldest once the buffers are full."""
+        self.processing_times[self._next] = processing_time_seconds
+        self.success_rates[self._next] = success_rate
+        self._next = (self._next + 1) % len(self.processing_times)
+        self.size += 1
+        self._total_processing_time += processing_time_seconds
+        self._total_success_rate += success_rate
+    
+    def _recent(self, column: np.ndarray, window: int) -> np.ndarray:
+        """The last ``window`` samples of a column, oldest first."""
+        window = min(window, self.size, len(column))
+        return np.take(column, np.arange(self._next - window, self._next), mode="wrap")
+    
+    def mean_processing_time(self, window: Optional[int] = None) -> float:
+        """Average processing time over all samples, or the last ``window``."""
+        if not window or window >= self.size:
+            return self._total_processing_time / self.size if self.size else float("nan")
+        return float(self._recent(self.processing_times, window).mean())
+    
+    def mean_success_rate(self, window: Optional[int] = None) -> float:
+        """Average success rate over all samples, or the last ``window``."""
+        if not window or window >= self.size:
+            return self._total_success_rate / self.size if self.size else float("nan")
+        return float(self._recent(self.success_rates, window).mean())
+
+
+# Samples per stage averaged for the recent performance figures
+_RECENT_STAGE_WINDOW = 100
+
+
 class PipelineMonitor(MessageHandler):
     """Handler for monitoring pipeline performance."""
     
     def __init__(self):
         self.execution_metrics: Dict[str, List[PipelineMetricsMessage]] = {}
-        self.stage_performance: Dict[str, List[float]] = {}
+        self.stage_performance: Dict[str, StagePerformanceSeries] = {}
         self.error_counts: Dict[str, int] = {}
     
     async def handle_pipeline_metrics(self, message: PipelineMetricsMessage) -> None:
@@ -216,8 +321,8 @@ class PipelineMonitor(MessageHandler):
         # Track stage performance
         stage = message.stage
         if stage not in self.stage_performance:
-            self.stage_performance[stage] = []
-        self.stage_performance[stage].append(message.processing_time_seconds)
+            self.stage_performance[stage] = StagePerformanceSeries()
+        self.stage_performance[stage].append(message.processing_time_seconds, message.success_rate)
         
         # Track errors
         if message.error_count > 0:
@@ -235,21 +340,40 @@ class PipelineMonitor(MessageHandler):
         
         # Calculate average processing times by stage
         avg_stage_times = {
-            stage: sum(times) / len(times)
-            for stage, times in self.stage_performance.items()
-            if times
+            stage: series.mean_processing_time()
+            for stage, series in self.stage_performance.items()
+            if series
+        }
+        avg_stage_success_rates = {
+            stage: series.mean_success_rate()
+            for stage, series in self.stage_performance.items()
+            if series
+        }
+        recent_stage_times = {
+            stage: series.mean_processing_time(window=_RECENT_STAGE_WINDOW)
+            for stage, series in self.stage_performance.items()
+            if series
+        }
+        recent_stage_success_rates = {
+            stage: series.mean_success_rate(window=_RECENT_STAGE_WINDOW)
+            for stage, series in self.stage_performance.items()
+            if series
         }
         
         # Recent executions
-        recent_executions = len([
-            exec_id for exec_id, metrics in self.execution_metrics.items()
-            if metrics and (datetime.utcnow() - metrics[-1].timestamp).total_seconds() < 3600
-        ])
+        cutoff = datetime.utcnow() - timedelta(hours=1)
+        recent_executions = sum(
+            1 for metrics in self.execution_metrics.values()
+            if metrics and metrics[-1].timestamp > cutoff
+        )
         
         return {
             "total_executions": len(self.execution_metrics),
             "recent_executions_last_hour": recent_executions,
             "avg_stage_processing_times": avg_stage_times,
+            "avg_stage_success_rates": avg_stage_success_rates,
+            "recent_stage_processing_times": recent_stage_times,
+            "recent_stage_success_rates": recent_stage_success_rates,
             "total_errors_by_stage": self.error_counts,
             "stages_monitored": list(self.stage_performance.keys())
         }
@@ -258,16 +382,26 @@ class PipelineMonitor(MessageHandler):
 class AlertProcessor(MessageHandler):
     """Handler for processing alerts and notifications."""
     
-    def __init__(self):
-        self.alerts: List[AlertMessage] = []
+    def __init__(self, max_alerts: int = 10_000):
+        # Most recent alerts only; older ones are dropped as new ones arrive
+        self.alerts: deque = deque(maxlen=max_alerts)
+        self.total_alerts = 0
         self.alert_counts_by_type: Dict[str, int] = {}
         self.alert_counts_by_severity: Dict[str, int] = {}
+        
+        # Monotonic receive times of the last hour's alerts, oldest first; capped
+        # like self.alerts so it stays bounded even if no summary is read
+        self._recent_alert_times: deque = deque(maxlen=max_alerts)
     
     async def handle_alert(self, message: AlertMessage) -> None:
         """Process incoming alerts."""
         
         # Store alert
         self.alerts.append(message)
+        self.total_alerts += 1
+        now = time.monotonic()
+        self._recent_alert_times.append(now)
+        self._prune_recent_alert_times(now)
         
         # Update counters
         self.alert_counts_by_type[message.alert_type] = (
@@ -282,7 +416,8 @@ class AlertProcessor(MessageHandler):
             await self._handle_critical_alert(message)
         
         # Log alert
-        print(f"Alert: [{message.severity.upper()}] {message.title}")
+        severity_label = _SEVERITY_LABELS.get(message.severity) or message.severity.upper()
+        print(f"Alert: [{severity_label}] {message.title}")
     
     async def _handle_critical_alert(self, message: AlertMessage) -> None:
         """Handle critical alerts with immediate action."""
@@ -304,17 +439,21 @@ class AlertProcessor(MessageHandler):
         if message.suggested_actions:
             print(f"Suggested actions: {', '.join(message.suggested_actions)}")
     
+    def _prune_recent_alert_times(self, now: float) -> None:
+        """Drop receive times older than an hour from the front; each is dropped once."""
+        hour_ago = now - 3600
+        recent_alert_times = self._recent_alert_times
+        while recent_alert_times and recent_alert_times[0] <= hour_ago:
+            recent_alert_times.popleft()
+    
     def get_alert_summary(self) -> Dict[str, Any]:
         """Get alert summary statistics."""
         
-        recent_alerts = [
-            alert for alert in self.alerts
-            if (datetime.utcnow() - alert.timestamp).total_seconds() < 3600
-        ]
+        self._prune_recent_alert_times(time.monotonic())
         
         return {
-            "total_alerts": len(self.alerts),
-            "recent_alerts_last_hour": len(recent_alerts),
+            "total_alerts": self.total_alerts,
+            "recent_alerts_last_hour": len(self._recent_alert_times),
             "alerts_by_type": self.alert_counts_by_type,
             "alerts_by_severity": self.alert_counts_by_severity,
             "latest_alerts": [
@@ -325,7 +464,7 @@ class AlertProcessor(MessageHandler):
                     "title": alert.title,
                     "timestamp": alert.timestamp
                 }
-                for alert in self.alerts[-10:]  # Last 10 alerts
+                for alert in reversed(list(islice(reversed(self.alerts), 10)))  # Last 10 alerts
             ]
         }
 
@@ -493,10 +632,12 @@ class KafkaConsumer(LoggerMixin):
             self.logger.error(f"Failed to process message: {e}")
     
     def _deserialize_message(self, message_bytes: bytes) -> Dict[str, Any]:
-        """Deserialize message from JSON bytes."""
+        """Deserialize message from JSON or msgpack bytes."""
         
         try:
-            return json.loads(message_bytes.decode())
+            if self.config.message_format == "msgpack":
+                return msgspec.msgpack.decode(message_bytes)
+            return orjson.loads(message_bytes)
         except Exception as e:
             self.logger.error(f"Failed to deserialize message: {e}")
             return {}
@@ -6,21 +6,27 @@ opportunities using Apache Kafka for real-time processing and notifications.
 """
 
 import asyncio
-import json
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 from decimal import Decimal
 import uuid
 
+import msgspec
 from aiokafka import AIOKafkaProducer
 from pydantic import BaseModel
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.core.config import settings
+from marketfinder_etl.core.serialization import dumps_json
 from marketfinder_etl.models.market import NormalizedMarket
 from marketfinder_etl.models.arbitrage import ArbitrageOpportunity
 
 
+# Compact binary encoding for pipeline-internal topics; Decimals become
+# strings to match the JSON payloads
+_msgpack_encoder = msgspec.msgpack.Encoder(decimal_format="string")
+
+
 class KafkaConfig(BaseModel):
     """Kafka producer configuration."""
     bootstrap_servers: str = "localhost:9092"
@@ -49,6 +55,9 @@ class KafkaConfig(BaseModel):
     # Performance settings
     buffer_memory: int = 33554432  # 32MB
     max_request_size: int = 1048576  # 1MB
+    
+    # Serialization settings
+    message_format: str = "json"  # "json" or "msgpack"
 
 
 class StreamingMessage(BaseModel):
@@ -327,10 +336,12 @@ class KafkaProducer(LoggerMixin):
     ) -> bool:
         """Send alert message."""
         
+        # One alert per message, so the message id doubles as the alert id
+        alert_id = str(uuid.uuid4())
         message = AlertMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=alert_id,
             timestamp=datetime.utcnow(),
-            alert_id=str(uuid.uuid4()),
+            alert_id=alert_id,
             alert_type=alert_type,
             severity=severity,
             title=title,
@@ -353,11 +364,13 @@ class KafkaProducer(LoggerMixin):
         profit_threshold = 0.1  # 10%
         
         if opportunity.metrics.expected_profit_percentage >= profit_threshold:
+            # Formatted once for both the title and the description
+            profit_text = f"{opportunity.metrics.expected_profit_percentage:.1%}"
             return await self.send_alert(
                 alert_type="high_profit_opportunity",
                 severity="high",
-                title=f"High Profit Arbitrage Detected: {opportunity.metrics.expected_profit_percentage:.1%}",
-                description=f"Found arbitrage opportunity between {opportunity.market1_title} and {opportunity.market2_title} with {opportunity.metrics.expected_profit_percentage:.1%} profit potential.",
+                title=f"High Profit Arbitrage Detected: {profit_text}",
+                description=f"Found arbitrage opportunity between {opportunity.market1_title} and {opportunity.market2_title} with {profit_text} profit potential.",
                 related_entity_type="opportunity",
                 related_entity_id=opportunity.opportunity_id,
                 suggested_actions=[
@@ -417,20 +430,16 @@ class KafkaProducer(LoggerMixin):
             return False
     
     def _serialize_message(self, message: Dict[str, Any]) -> bytes:
-        """Serialize message to JSON bytes."""
-        
-        # Handle Decimal serialization
-        def json_serializer(obj):
-            if isinstance(obj, Decimal):
-                return float(obj)
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        """Serialize message to JSON or msgpack bytes."""
         
-        json_str = json.dumps(message, default=json_serializer, separators=(',', ':'))
-        self.bytes_sent += len(json_str.encode())
+        if self.config.message_format == "msgpack":
+            payload = _msgpack_encoder.encode(message)
+        else:
+            # orjson writes datetimes as ISO-8601 and emits bytes directly
+            payload = dumps_json(message)
+        self.bytes_sent += len(payload)
         
-        return json_str.encode()
+        return payload
     
     def _market_to_dict(self, market: NormalizedMarket) -> Dict[str, Any]:
         """Convert market to dictionary for streaming."""
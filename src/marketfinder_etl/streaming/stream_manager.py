@@ -6,9 +6,10 @@ producers, consumers, and stream processing for real-time market analysis.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Callable
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, Callable
 from datetime import datetime
-import uuid
 
 from pydantic import BaseModel
 
@@ -19,6 +20,13 @@ from marketfinder_etl.models.market import NormalizedMarket
 from marketfinder_etl.models.arbitrage import ArbitrageOpportunity
 
 
+# Hard cap on the critical alert dedup table; the oldest entries go first
+_DEDUP_MAX_ENTRIES = 10_000
+
+# Idle wait before rechecking for scheduled opportunity expiries
+_EXPIRY_IDLE_SLEEP_SECONDS = 60.0
+
+
 class StreamingConfig(BaseModel):
     """Comprehensive streaming configuration."""
     # Kafka settings
@@ -42,6 +50,7 @@ class StreamingConfig(BaseModel):
     enable_real_time_alerts: bool = True
     high_profit_threshold: float = 0.1  # 10%
     critical_alert_threshold: float = 0.2  # 20%
+    alert_dedup_window_seconds: float = 60.0  # Repeat critical alerts per opportunity are dropped
     
     # Performance settings
     max_concurrent_handlers: int = 10
@@ -64,6 +73,7 @@ class StreamMetrics(BaseModel):
     # Real-time processing
     arbitrage_opportunities_detected: int = 0
     high_profit_alerts_sent: int = 0
+    duplicate_alerts_suppressed: int = 0
     pipeline_executions_monitored: int = 0
     
     # System health
@@ -96,6 +106,13 @@ class StreamManager(LoggerMixin):
         self.notification_callbacks: List[Callable] = []
         self.processing_tasks: List[asyncio.Task] = []
         
+        # Bounds in-flight notification deliveries so alert bursts cannot
+        # spawn an unbounded number of concurrent sends
+        self._delivery_semaphore = asyncio.Semaphore(self.config.max_concurrent_handlers)
+        
+        # Monotonic time each opportunity last raised a critical alert, oldest first
+        self._critical_alert_times: OrderedDict[str, float] = OrderedDict()
+        
         # Message queues for batch processing
         self.pending_market_updates: List[Dict] = []
         self.pending_opportunities: List[Dict] = []
@@ -150,14 +167,11 @@ class StreamManager(LoggerMixin):
         try:
             self.is_running = False
             
-            # Stop processing tasks
+            # Stop processing tasks, cancelling all before waiting on any so
+            # shutdown takes the slowest task's time rather than the sum
             for task in self.processing_tasks:
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+                task.cancel()
+            await asyncio.gather(*self.processing_tasks, return_exceptions=True)
             
             self.processing_tasks.clear()
             
@@ -195,6 +209,11 @@ class StreamManager(LoggerMixin):
         batch_task = asyncio.create_task(self._process_batches_periodically())
         self.processing_tasks.append(batch_task)
         
+        # Opportunity expiry task
+        if self.consumer:
+            expiry_task = asyncio.create_task(self._expire_opportunities_when_due())
+            self.processing_tasks.append(expiry_task)
+        
         self.logger.info("Background processing tasks started")
     
     async def _collect_metrics_periodically(self) -> None:
@@ -225,6 +244,34 @@ class StreamManager(LoggerMixin):
                 self.logger.error(f"Error processing batches: {e}")
                 await asyncio.sleep(1)
     
+    async def _expire_opportunities_when_due(self) -> None:
+        """Expire active opportunities, sleeping until the next scheduled expiry."""
+        
+        handler = self.consumer.arbitrage_handler
+        
+        while self.is_running:
+            try:
+                next_expiry = handler.next_expiry()
+                if next_expiry is None:
+                    await asyncio.sleep(_EXPIRY_IDLE_SLEEP_SECONDS)
+                    continue
+                
+                delay = (next_expiry - datetime.utcnow()).total_seconds()
+                if delay > 0:
+                    # Cap the wait so earlier expiries scheduled meanwhile are not missed
+                    await asyncio.sleep(min(delay, _EXPIRY_IDLE_SLEEP_SECONDS))
+                    continue
+                
+                expired = handler.expire_due_opportunities()
+                if expired:
+                    self.logger.debug(f"Expired {expired} arbitrage opportunities")
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error expiring opportunities: {e}")
+                await asyncio.sleep(1)
+    
     async def _update_metrics(self) -> None:
         """Update streaming metrics."""
         
@@ -262,19 +309,27 @@ class StreamManager(LoggerMixin):
     async def _process_pending_batches(self) -> None:
         """Process pending message batches."""
         
+        batch_jobs = []
+        
         # Process market updates batch
         if len(self.pending_market_updates) >= self.config.message_batch_size:
             batch = self.pending_market_updates[:self.config.message_batch_size]
             self.pending_market_updates = self.pending_market_updates[self.config.message_batch_size:]
             
-            await self._process_market_update_batch(batch)
+            batch_jobs.append(self._process_market_update_batch(batch))
         
         # Process arbitrage opportunities batch
         if len(self.pending_opportunities) >= self.config.message_batch_size:
             batch = self.pending_opportunities[:self.config.message_batch_size]
             self.pending_opportunities = self.pending_opportunities[self.config.message_batch_size:]
             
-            await self._process_opportunity_batch(batch)
+            batch_jobs.append(self._process_opportunity_batch(batch))
+        
+        # The two batch types are independent, so run them concurrently
+        results = await asyncio.gather(*batch_jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing batch: {result}")
     
     async def _process_market_update_batch(self, batch: List[Dict]) -> None:
         """Process batch of market updates."""
@@ -310,12 +365,13 @@ class StreamManager(LoggerMixin):
             if profit_percentage >= self.config.high_profit_threshold:
                 self.metrics.high_profit_alerts_sent += 1
                 
-                # Send critical alert for very high profit
+                # Send critical alert for very high profit alongside
+                # notifying registered callbacks
+                deliveries = [self._notify_callbacks(notification)]
                 if profit_percentage >= self.config.critical_alert_threshold:
-                    await self._send_critical_alert(notification)
+                    deliveries.append(self._deliver(self._send_critical_alert(notification)))
                 
-                # Notify registered callbacks
-                await self._notify_callbacks(notification)
+                await asyncio.gather(*deliveries)
             
         except Exception as e:
             self.logger.error(f"Error handling arbitrage notification: {e}")
@@ -323,12 +379,18 @@ class StreamManager(LoggerMixin):
     async def _send_critical_alert(self, notification: Dict) -> None:
         """Send critical alert for high-profit opportunities."""
         
+        if self._is_duplicate_critical_alert(notification["opportunity_id"]):
+            self.metrics.duplicate_alerts_suppressed += 1
+            return
+        
         if self.producer:
+            # Formatted once for both the title and the description
+            profit_text = f"{notification['profit_percentage']:.1%}"
             await self.producer.send_alert(
                 alert_type="critical_arbitrage_opportunity",
                 severity="critical",
-                title=f"Critical Arbitrage: {notification['profit_percentage']:.1%} Profit",
-                description=f"Exceptional arbitrage opportunity detected: {notification['market_pair']} with {notification['profit_percentage']:.1%} profit potential (${notification['profit_usd']:.2f})",
+                title=f"Critical Arbitrage: {profit_text} Profit",
+                description=f"Exceptional arbitrage opportunity detected: {notification['market_pair']} with {profit_text} profit potential (${notification['profit_usd']:.2f})",
                 related_entity_type="opportunity",
                 related_entity_id=notification["opportunity_id"],
                 suggested_actions=[
@@ -339,14 +401,45 @@ class StreamManager(LoggerMixin):
                 ]
             )
     
+    def _is_duplicate_critical_alert(self, opportunity_id: str) -> bool:
+        """Check whether the opportunity already alerted within the dedup window."""
+        
+        now = time.monotonic()
+        window = self.config.alert_dedup_window_seconds
+        
+        alert_times = self._critical_alert_times
+        
+        last_alerted = alert_times.get(opportunity_id)
+        if last_alerted is not None and now - last_alerted < window:
+            return True
+        
+        # Entries are kept in alert-time order, so expired ones sit at the front
+        while alert_times and now - next(iter(alert_times.values())) >= window:
+            alert_times.popitem(last=False)
+        
+        alert_times[opportunity_id] = now
+        alert_times.move_to_end(opportunity_id)
+        if len(alert_times) > _DEDUP_MAX_ENTRIES:
+            alert_times.popitem(last=False)
+        return False
+    
     async def _notify_callbacks(self, notification: Dict) -> None:
         """Notify registered callbacks about events."""
         
-        for callback in self.notification_callbacks:
-            try:
-                await callback(notification)
-            except Exception as e:
-                self.logger.error(f"Notification callback failed: {e}")
+        # Callbacks are independent, so a slow one does not delay the rest
+        results = await asyncio.gather(
+            *(self._deliver(callback(notification)) for callback in self.notification_callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Notification callback failed: {result}")
+    
+    async def _deliver(self, delivery: Awaitable[Any]) -> Any:
+        """Await a notification delivery within the concurrency limit."""
+        
+        async with self._delivery_semaphore:
+            return await delivery
     
     # Public streaming methods
     
@@ -421,7 +514,7 @@ class StreamManager(LoggerMixin):
             "uptime_seconds": self.metrics.uptime_seconds,
             "producer_connected": self.producer.is_connected if self.producer else False,
             "consumer_running": self.consumer.is_running if self.consumer else False,
-            "active_tasks": len([t for t in self.processing_tasks if not t.done()]),
+            "active_tasks": sum(1 for t in self.processing_tasks if not t.done()),
             "metrics": self.metrics.dict(),
             "last_activity": self.metrics.last_activity.isoformat() if self.metrics.last_activity else None
         }
@@ -15,12 +15,23 @@ from enum import Enum
 
 import polars as pl
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.models.market import NormalizedMarket, MarketPlatform
 
 
+# Keywords used for the simple title/description sentiment score
+_POSITIVE_KEYWORDS = (
+    "will", "likely", "expected", "strong", "positive", "bullish", 
+    "growth", "increase", "win", "success", "good", "high"
+)
+_NEGATIVE_KEYWORDS = (
+    "unlikely", "decline", "fall", "negative", "bearish", "loss",
+    "fail", "drop", "weak", "low", "poor", "crisis"
+)
+
+
 class EnrichmentType(str, Enum):
     """Types of data enrichment."""
     HISTORICAL_CONTEXT = "historical_context"
@@ -60,7 +71,12 @@ class EnrichmentConfig:
             self.sentiment_sources = ["title", "description"]
 
 
-class HistoricalContext(BaseModel):
+class ImmutableBaseModel(BaseModel):
+    """Base for enrichment results that are never modified after construction."""
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="forbid")
+
+
+class HistoricalContext(ImmutableBaseModel):
     """Historical context for a market."""
     avg_price_last_week: Optional[Decimal] = None
     price_change_percentage: Optional[float] = None
@@ -69,7 +85,7 @@ class HistoricalContext(BaseModel):
     historical_accuracy: Optional[float] = None
 
 
-class VolatilityMetrics(BaseModel):
+class VolatilityMetrics(ImmutableBaseModel):
     """Volatility metrics for a market."""
     price_volatility: float
     volume_volatility: float
@@ -78,7 +94,7 @@ class VolatilityMetrics(BaseModel):
     risk_score: float  # 0-1 scale
 
 
-class MarketSentiment(BaseModel):
+class MarketSentiment(ImmutableBaseModel):
     """Market sentiment analysis."""
     sentiment_score: float  # -1 to 1 scale
     sentiment_label: str  # "positive", "negative", "neutral"
@@ -87,7 +103,7 @@ class MarketSentiment(BaseModel):
     sentiment_sources: List[str] = []
 
 
-class TrendAnalysis(BaseModel):
+class TrendAnalysis(ImmutableBaseModel):
     """Trend analysis for market data."""
     price_trend: str  # "bullish", "bearish", "sideways"
     trend_strength: float  # 0-1 scale
@@ -340,22 +356,10 @@ class DataEnricher(LoggerMixin):
         # Simple sentiment analysis based on keywords
         text_to_analyze = f"{market.title} {market.description or ''}"
         
-        # Positive sentiment keywords
-        positive_keywords = [
-            "will", "likely", "expected", "strong", "positive", "bullish", 
-            "growth", "increase", "win", "success", "good", "high"
-        ]
-        
-        # Negative sentiment keywords
-        negative_keywords = [
-            "unlikely", "decline", "fall", "negative", "bearish", "loss",
-            "fail", "drop", "weak", "low", "poor", "crisis"
-        ]
-        
         text_lower = text_to_analyze.lower()
         
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
+        positive_count = sum(1 for word in _POSITIVE_KEYWORDS if word in text_lower)
+        negative_count = sum(1 for word in _NEGATIVE_KEYWORDS if word in text_lower)
         
         # Calculate sentiment score
         total_sentiment_words = positive_count + negative_count
@@ -375,7 +379,7 @@ class DataEnricher(LoggerMixin):
             confidence = min(0.9, total_sentiment_words / 10)  # Higher confidence with more sentiment words
         
         # Extract key phrases (mock implementation)
-        key_phrases = [word for word in positive_keywords + negative_keywords if word in text_lower]
+        key_phrases = [word for word in _POSITIVE_KEYWORDS + _NEGATIVE_KEYWORDS if word in text_lower]
         
         return MarketSentiment(
             sentiment_score=sentiment_score,
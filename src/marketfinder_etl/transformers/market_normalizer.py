@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 import polars as pl
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
 
 from marketfinder_etl.core.logging import LoggerMixin
 from marketfinder_etl.models.market import (
@@ -23,6 +23,17 @@ from marketfinder_etl.models.market import (
 from marketfinder_etl.models.raw_data import RawMarketData
 
 
+# Explicit Kalshi status values and the MarketStatus they map to
+_KALSHI_STATUS_MAPPING = {
+    "open": MarketStatus.ACTIVE,
+    "active": MarketStatus.ACTIVE,
+    "closed": MarketStatus.CLOSED,
+    "settled": MarketStatus.CLOSED,
+    "suspended": MarketStatus.SUSPENDED,
+    "halted": MarketStatus.SUSPENDED,
+}
+
+
 class NormalizationRule(str, Enum):
     """Types of normalization rules."""
     TITLE_CLEANUP = "title_cleanup"
@@ -553,21 +564,16 @@ class MarketNormalizer(LoggerMixin):
     def _determine_kalshi_status(self, data: Dict[str, Any]) -> MarketStatus:
         """Determine market status from Kalshi data."""
         
-        status = data.get("status", "").lower()
+        status = _KALSHI_STATUS_MAPPING.get(data.get("status", "").lower())
+        if status is not None:
+            return status
         
-        if status in ["open", "active"]:
-            return MarketStatus.ACTIVE
-        elif status in ["closed", "settled"]:
+        # Infer from dates
+        close_time = self._parse_date(data.get("close_time"))
+        if close_time and close_time < datetime.utcnow():
             return MarketStatus.CLOSED
-        elif status in ["suspended", "halted"]:
-            return MarketStatus.SUSPENDED
         else:
-            # Infer from dates
-            close_time = self._parse_date(data.get("close_time"))
-            if close_time and close_time < datetime.utcnow():
-                return MarketStatus.CLOSED
-            else:
-                return MarketStatus.ACTIVE
+            return MarketStatus.ACTIVE
     
     def _determine_polymarket_status(self, data: Dict[str, Any]) -> MarketStatus:
         """Determine market status from Polymarket data."""
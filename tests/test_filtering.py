@@ -0,0 +1,86 @@
+"""Tests for the hierarchical filtering engine."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from marketfinder_etl.engines.filtering import FilterConfig, HierarchicalFilteringEngine
+from marketfinder_etl.models.market import (
+    MarketEventType,
+    MarketOutcome,
+    MarketPlatform,
+    NormalizedMarket,
+)
+
+
+def _market(platform: MarketPlatform, external_id: str, yes_price: str, volume: str = "100") -> NormalizedMarket:
+    price = Decimal(yes_price)
+    return NormalizedMarket(
+        platform=platform,
+        external_id=external_id,
+        title=f"Market {external_id}",
+        description=f"Market {external_id}",
+        category="Politics",
+        tags=["politics"],
+        event_type=MarketEventType.BINARY,
+        outcomes=[
+            MarketOutcome(name="Yes", price=price),
+            MarketOutcome(name="No", price=Decimal("1") - price),
+        ],
+        end_date=datetime(2030, 1, 1),
+        volume=Decimal(volume),
+        liquidity=Decimal("1000"),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("kalshi_price", "polymarket_price"),
+    [
+        ("0.05", "0.07"),  # Kalshi at min_price_range, spread at min_arbitrage_potential
+        ("0.95", "0.93"),  # Kalshi at max_price_range
+        ("0.07", "0.05"),  # Polymarket at min_price_range
+    ],
+)
+async def test_basic_compatibility_bounds_are_inclusive(kalshi_price, polymarket_price):
+    engine = HierarchicalFilteringEngine(FilterConfig())
+
+    pairs = await engine._basic_compatibility_filter(
+        [_market(MarketPlatform.KALSHI, "k1", kalshi_price)],
+        [_market(MarketPlatform.POLYMARKET, "p1", polymarket_price)],
+        "politics",
+    )
+
+    assert len(pairs) == 1
+    assert pairs[0].price_difference == Decimal("0.02")
+
+
+@pytest.mark.asyncio
+async def test_basic_compatibility_accepts_volume_at_threshold():
+    engine = HierarchicalFilteringEngine(FilterConfig(min_volume_threshold=100.0))
+
+    pairs = await engine._basic_compatibility_filter(
+        [_market(MarketPlatform.KALSHI, "k1", "0.40", volume="100")],
+        [_market(MarketPlatform.POLYMARKET, "p1", "0.50", volume="100")],
+        "politics",
+    )
+
+    assert len(pairs) == 1
+
+
+@pytest.mark.asyncio
+async def test_basic_compatibility_rejects_just_outside_bounds():
+    engine = HierarchicalFilteringEngine(FilterConfig())
+
+    pairs = await engine._basic_compatibility_filter(
+        [
+            _market(MarketPlatform.KALSHI, "k1", "0.04"),  # Below min_price_range
+            _market(MarketPlatform.KALSHI, "k2", "0.96"),  # Above max_price_range
+            _market(MarketPlatform.KALSHI, "k3", "0.50"),
+        ],
+        [_market(MarketPlatform.POLYMARKET, "p1", "0.519")],  # Spread below min_arbitrage_potential
+        "politics",
+    )
+
+    assert pairs == []
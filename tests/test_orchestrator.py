@@ -0,0 +1,36 @@
+"""Tests for pipeline execution records."""
+
+from datetime import datetime
+
+import orjson
+
+from marketfinder_etl.pipeline.orchestrator import (
+    PipelineConfig,
+    PipelineExecution,
+    PipelineStage,
+    PipelineStatus,
+    StageMetrics,
+)
+
+
+def test_model_dump_json_fast_serializes_stage_metrics():
+    execution = PipelineExecution(
+        execution_id="exec-1",
+        status=PipelineStatus.RUNNING,
+        config=PipelineConfig(),
+        started_at=datetime(2024, 1, 1),
+    )
+    execution.stage_metrics[PipelineStage.EXTRACTION] = StageMetrics(
+        stage=PipelineStage.EXTRACTION,
+        input_count=10,
+        output_count=8,
+        success_count=8,
+        error_count=2,
+        processing_time_seconds=2.0,
+    )
+
+    payload = orjson.loads(execution.model_dump_json_fast())
+
+    extraction = payload["stage_metrics"]["extraction"]
+    assert extraction["output_count"] == 8
+    assert extraction["throughput_per_second"] == 5.0
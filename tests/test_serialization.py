@@ -0,0 +1,19 @@
+"""Tests for the shared JSON serialization helpers."""
+
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from marketfinder_etl.core.serialization import dumps_json
+
+
+def test_dumps_json_keeps_decimal_precision():
+    payload = orjson.loads(dumps_json({"price": Decimal("0.1234")}))
+
+    assert Decimal(payload["price"]) == Decimal("0.1234")
+
+
+def test_dumps_json_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps_json({"value": object()})